@@ -12,6 +12,19 @@ except ImportError:
     # Use real market data via alternative APIs for non-Windows systems
     import yfinance as yf
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    # Pooled HTTP session shared by every Yahoo Finance request in this process
+    _SESSION = requests.Session()
+    _adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(total=2, backoff_factor=0.1)
+    )
+    _SESSION.mount('https://', _adapter)
+    _SESSION.mount('http://', _adapter)
+    _GOLD_TICKER = yf.Ticker('GC=F', session=_SESSION)  # Gold futures
 
     class RealDataMT5:
         TIMEFRAME_M1 = 1
@@ -49,9 +62,7 @@ except ImportError:
             try:
                 if symbol == 'XAUUSD':
                     # Get real-time gold price
-                    ticker = yf.Ticker('GC=F')
-                    info = ticker.info
-                    hist = ticker.history(period='1d', interval='1m')
+                    hist = _GOLD_TICKER.history(period='1d', interval='1m')
 
                     if not hist.empty:
                         current_price = float(hist['Close'].iloc[-1])
@@ -103,8 +114,7 @@ except ImportError:
                         period = '2y'   # Last 2 years for hourly/daily
 
                     # Fetch real gold data
-                    ticker = yf.Ticker('GC=F')  # Gold futures
-                    hist = ticker.history(period=period, interval=interval)
+                    hist = _GOLD_TICKER.history(period=period, interval=interval)
 
                     if not hist.empty:
                         # Convert to MT5 format
@@ -608,33 +618,10 @@ class MT5Connector:
 
         try:
             # Real MT5 trade execution
-            price = mt5.symbol_info_tick(symbol)
-            if price is None:
+            request = self._build_trade_request(symbol, trade_type, volume, stop_loss, take_profit, comment)
+            if request is None:
                 return {'success': False, 'error': 'Failed to get current price'}
-
-            # Determine order type and price
-            if trade_type == 'BUY':
-                order_type = mt5.ORDER_TYPE_BUY
-                execution_price = price.ask
-            else:
-                order_type = mt5.ORDER_TYPE_SELL
-                execution_price = price.bid
-
-            # Prepare trade request
-            request = {
-                "action": mt5.TRADE_ACTION_DEAL,
-                "symbol": symbol,
-                "volume": volume,
-                "type": order_type,
-                "price": execution_price,
-                "sl": stop_loss,
-                "tp": take_profit,
-                "deviation": 20,
-                "magic": 234000,
-                "comment": comment,
-                "type_time": mt5.ORDER_TIME_GTC,
-                "type_filling": mt5.ORDER_FILLING_IOC,
-            }
+            execution_price = request['price']
 
             # Send trade request
             result = mt5.order_send(request)
@@ -661,6 +648,97 @@ class MT5Connector:
             logger.error(f"Trade execution error: {str(e)}")
             return {'success': False, 'error': str(e)}
 
+    def check_trade(self, symbol: str, trade_type: str, volume: float,
+                    stop_loss: float, take_profit: float) -> Dict[str, any]:
+        """
+        Validate a trade with the broker without executing it (mt5.order_check)
+
+        Args:
+            symbol: Trading symbol (XAUUSD)
+            trade_type: 'BUY' or 'SELL'
+            volume: Lot size
+            stop_loss: Stop loss price
+            take_profit: Take profit price
+
+        Returns:
+            Check result with the price the trade would execute at
+        """
+        if not self.connected:
+            return {'success': False, 'error': 'MT5 not connected'}
+
+        if not MT5_AVAILABLE:
+            # Paper trading only needs a live price
+            price = self.get_current_price(symbol)
+            if price is None:
+                return {'success': False, 'error': 'Failed to get current price'}
+            return {
+                'success': True,
+                'price': price['bid' if trade_type == 'SELL' else 'ask'],
+                'mode': 'PAPER_TRADING'
+            }
+
+        try:
+            account = mt5.account_info()
+            if account is not None and not account.trade_allowed:
+                return {'success': False, 'error': 'Trading is not allowed on this account'}
+
+            request = self._build_trade_request(symbol, trade_type, volume, stop_loss, take_profit, "Trade Check")
+            if request is None:
+                return {'success': False, 'error': 'Failed to get current price'}
+
+            result = mt5.order_check(request)
+            if result is None:
+                return {'success': False, 'error': f"Trade check failed: {mt5.last_error()}"}
+
+            if result.retcode != 0:
+                return {
+                    'success': False,
+                    'error': f"Trade check failed: {result.retcode}",
+                    'comment': result.comment
+                }
+
+            return {
+                'success': True,
+                'price': request['price'],
+                'margin': result.margin,
+                'mode': 'LIVE_TRADING'
+            }
+
+        except Exception as e:
+            logger.error(f"Trade check error: {str(e)}")
+            return {'success': False, 'error': str(e)}
+
+    @staticmethod
+    def _build_trade_request(symbol: str, trade_type: str, volume: float,
+                             stop_loss: float, take_profit: float, comment: str) -> Optional[Dict]:
+        """Build a market deal request at the current price (None if no price)"""
+        price = mt5.symbol_info_tick(symbol)
+        if price is None:
+            return None
+
+        # Determine order type and price
+        if trade_type == 'BUY':
+            order_type = mt5.ORDER_TYPE_BUY
+            execution_price = price.ask
+        else:
+            order_type = mt5.ORDER_TYPE_SELL
+            execution_price = price.bid
+
+        return {
+            "action": mt5.TRADE_ACTION_DEAL,
+            "symbol": symbol,
+            "volume": volume,
+            "type": order_type,
+            "price": execution_price,
+            "sl": stop_loss,
+            "tp": take_profit,
+            "deviation": 20,
+            "magic": 234000,
+            "comment": comment,
+            "type_time": mt5.ORDER_TIME_GTC,
+            "type_filling": mt5.ORDER_FILLING_IOC,
+        }
+
     def close_trade(self, ticket: int) -> Dict[str, any]:
         """
         Close existing trade by ticket number
@@ -7,10 +7,23 @@ Based on the forum solution by David _Detnator_
 
 import requests
 import json
+import numpy as np
 import pandas as pd
 from datetime import datetime
 import logging
 
+try:
+    import zmq
+    ZMQ_AVAILABLE = True
+except ImportError:
+    ZMQ_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 class MT5RestBridge:
@@ -27,10 +40,15 @@ class MT5RestBridge:
             bridge_host: IP address of Windows machine running MT5 REST server
             bridge_port: Port of the REST API server
         """
+        self.bridge_host = bridge_host
         self.base_url = f"http://{bridge_host}:{bridge_port}"
         self.session = requests.Session()
         self.session.timeout = 30
         
+        # Local copy of open positions kept in sync by get_positions_delta()
+        self._positions = {}
+        self._positions_etag = None
+        
     def test_connection(self):
         """Test connection to MT5 REST bridge"""
         try:
@@ -65,17 +83,33 @@ class MT5RestBridge:
         except Exception as e:
             return {"success": False, "message": f"Error: {str(e)}"}
     
-    def get_market_data(self, symbol="XAUUSD", timeframe="M5", count=100):
-        """Get market data via REST API"""
+    def get_market_data(self, symbol="XAUUSD", timeframe="M5", count=100, from_time=None):
+        """
+        Get market data via REST API
+        
+        Args:
+            from_time: Optional unix time of the newest bar already held; only
+                bars from that time onward are returned (count is ignored)
+        """
         try:
             params = {
                 "symbol": symbol,
                 "timeframe": timeframe,
-                "count": count
+                "count": count,
+                "format": "binary"
             }
+            if from_time is not None:
+                params["from_time"] = int(from_time)
             response = self.session.get(f"{self.base_url}/mt5/rates", params=params)
             
-            if response.status_code == 200:
+            if response.status_code == 200 and "X-Dtype" in response.headers:
+                # Raw MT5 structured array; decode straight into columns
+                dtype = np.dtype([tuple(field) for field in json.loads(response.headers["X-Dtype"])])
+                df = pd.DataFrame(np.frombuffer(response.content, dtype=dtype))
+                if not df.empty:
+                    df['datetime'] = pd.to_datetime(df['time'], unit='s')
+                return df
+            elif response.status_code == 200:
                 data = response.json()
                 if data.get("success"):
                     # Convert to DataFrame
@@ -97,6 +131,42 @@ class MT5RestBridge:
             logger.error(f"Error getting market data: {str(e)}")
             return pd.DataFrame()
     
+    def get_market_data_batch(self, rate_requests):
+        """
+        Get market data for several symbol/timeframe pairs in one round trip
+        
+        Args:
+            rate_requests: List of {"symbol", "timeframe", "count"} dictionaries
+            
+        Returns:
+            Dictionary of DataFrames keyed by "<symbol>_<timeframe>"
+        """
+        try:
+            response = self.session.post(
+                f"{self.base_url}/mt5/rates/batch",
+                json={"requests": rate_requests}
+            )
+            
+            if response.status_code != 200:
+                logger.error(f"REST API request failed: {response.status_code}")
+                return {}
+            
+            data = response.json()
+            for key, error in data.get("errors", {}).items():
+                logger.error(f"MT5 REST API error for {key}: {error}")
+            
+            market_data = {}
+            for key, rates_data in data.get("data", {}).items():
+                df = pd.DataFrame(rates_data)
+                if not df.empty:
+                    df['datetime'] = pd.to_datetime(df['time'], unit='s')
+                market_data[key] = df
+            return market_data
+            
+        except Exception as e:
+            logger.error(f"Error getting batch market data: {str(e)}")
+            return {}
+    
     def place_order(self, symbol, order_type, volume, price=None, sl=None, tp=None):
         """Place order via REST API"""
         try:
@@ -135,6 +205,41 @@ class MT5RestBridge:
             logger.error(f"Error getting positions: {str(e)}")
             return []
     
+    def get_positions_delta(self):
+        """
+        Get open positions, transferring only what changed since the last call
+        
+        Returns:
+            List of position dictionaries (same shape as get_positions)
+        """
+        try:
+            params = {"since_etag": self._positions_etag} if self._positions_etag else {}
+            response = self.session.get(f"{self.base_url}/mt5/positions/delta", params=params)
+            if response.status_code != 200:
+                return list(self._positions.values())
+            
+            data = response.json()
+            if not data.get("success"):
+                return list(self._positions.values())
+            
+            if data.get("full"):
+                self._positions = {pos["ticket"]: pos for pos in data.get("positions", [])}
+            else:
+                for ticket in data.get("removed", []):
+                    self._positions.pop(ticket, None)
+                for pos in data.get("added", []):
+                    self._positions[pos["ticket"]] = pos
+                for change in data.get("updated", []):
+                    if change["ticket"] in self._positions:
+                        self._positions[change["ticket"]].update(change)
+            
+            self._positions_etag = data.get("etag")
+            return list(self._positions.values())
+            
+        except Exception as e:
+            logger.error(f"Error getting position updates: {str(e)}")
+            return list(self._positions.values())
+    
     def close_position(self, ticket):
         """Close position via REST API"""
         try:
@@ -146,6 +251,36 @@ class MT5RestBridge:
         except Exception as e:
             return {"success": False, "message": f"Error: {str(e)}"}
 
+    def subscribe_ticks(self, symbols=("XAUUSD",), port=5556):
+        """
+        Stream ticks pushed by the server's ZeroMQ publisher (requires pyzmq)
+        
+        Args:
+            symbols: Symbols to subscribe to
+            port: Tick publisher port on the bridge host
+            
+        Yields:
+            Tick dictionaries (symbol, time, time_msc, bid, ask, last, volume)
+        """
+        if not ZMQ_AVAILABLE:
+            raise ImportError("pyzmq is required for tick streaming (pip install pyzmq)")
+        
+        socket = zmq.Context.instance().socket(zmq.SUB)
+        socket.connect(f"tcp://{self.bridge_host}:{port}")
+        for symbol in symbols:
+            socket.setsockopt(zmq.SUBSCRIBE, symbol.encode())
+        
+        try:
+            while True:
+                _, payload = socket.recv_multipart()
+                # The server packs with msgpack when it has it, JSON otherwise
+                if MSGPACK_AVAILABLE and payload[:1] != b'{':
+                    yield msgpack.unpackb(payload)
+                else:
+                    yield json.loads(payload)
+        finally:
+            socket.close(linger=0)
+
 # Configuration for different setups
 MT5_BRIDGE_CONFIGS = {
     "local_vm": {
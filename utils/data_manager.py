@@ -17,6 +17,51 @@ from pathlib import Path
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Write statements are kept as module constants so every call hands sqlite3
+# the identical string and hits its per-connection statement cache
+_SQL_INSERT_TRADE = """
+    INSERT INTO trades (
+        entry_time, exit_time, direction, entry_price, exit_price,
+        stop_loss, take_profit, lot_size, pnl, status,
+        confidence, setup_quality, smc_steps, reasoning,
+        session, timeframe
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    RETURNING id
+"""
+
+_SQL_UPSERT_PERFORMANCE_METRICS = """
+    INSERT OR REPLACE INTO performance_metrics (
+        date, daily_pnl, cumulative_pnl, trades_count,
+        winning_trades, losing_trades, win_rate,
+        max_drawdown, account_balance, risk_utilization
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_MARKET_ANALYSIS = """
+    INSERT INTO market_analysis (
+        timeframe, current_price, trend, session,
+        order_blocks_count, bos_detected, liquidity_grabs_count,
+        vwap, rsi, atr, setup_quality, ai_confidence, analysis_data
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_SYSTEM_EVENT = """
+    INSERT INTO system_events (event_type, severity, message, details)
+    VALUES (?, ?, ?, ?)
+"""
+
+_SQL_UPDATE_BOT_STATE = """
+    UPDATE bot_state SET
+        is_running = ?,
+        trading_mode = ?,
+        risk_percentage = ?,
+        max_risk_amount = ?,
+        last_updated = CURRENT_TIMESTAMP,
+        session_id = ?,
+        configuration = ?
+    WHERE id = 1
+"""
+
 class DataManager:
     """
     Comprehensive data management for trading bot
@@ -138,10 +183,10 @@ class DataManager:
                 conn.commit()
                 logger.info("Database tables initialized successfully")
                 
-        except Exception as e:
-            logger.error(f"Database initialization error: {str(e)}")
+        except sqlite3.Error:
+            logger.exception("Database initialization error")
     
-    def save_trade(self, trade_data: Dict) -> bool:
+    def save_trade(self, trade_data: Dict) -> Optional[int]:
         """
         Save trade record to database
         
@@ -149,21 +194,15 @@ class DataManager:
             trade_data: Trade information dictionary
             
         Returns:
-            True if saved successfully
+            Row id of the new trade, or None if the save failed
         """
         try:
             with sqlite3.connect(self.db_path) as conn:
                 # Prepare trade data
                 smc_steps = json.dumps(trade_data.get('smc_steps', []))
                 
-                conn.execute("""
-                    INSERT INTO trades (
-                        entry_time, exit_time, direction, entry_price, exit_price,
-                        stop_loss, take_profit, lot_size, pnl, status,
-                        confidence, setup_quality, smc_steps, reasoning,
-                        session, timeframe
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+                # RETURNING hands back the new row id in the same round trip
+                cursor = conn.execute(_SQL_INSERT_TRADE, (
                     trade_data.get('entry_time'),
                     trade_data.get('exit_time'),
                     trade_data.get('direction'),
@@ -181,14 +220,15 @@ class DataManager:
                     trade_data.get('session'),
                     trade_data.get('timeframe')
                 ))
+                trade_id = cursor.fetchone()[0]
                 
                 conn.commit()
                 logger.info(f"Trade saved: {trade_data.get('direction')} at {trade_data.get('entry_price')}")
-                return True
+                return trade_id
                 
-        except Exception as e:
-            logger.error(f"Error saving trade: {str(e)}")
-            return False
+        except (sqlite3.Error, TypeError):
+            logger.exception("Error saving trade")
+            return None
     
     def get_trade_history(self, days: int = 30, limit: int = 100) -> pd.DataFrame:
         """
@@ -220,8 +260,8 @@ class DataManager:
                 
                 return df
                 
-        except Exception as e:
-            logger.error(f"Error getting trade history: {str(e)}")
+        except (sqlite3.Error, pd.errors.DatabaseError, json.JSONDecodeError):
+            logger.exception("Error getting trade history")
             return pd.DataFrame()
 
     def get_recent_trades(self, limit: int = 10) -> List[Dict]:
@@ -265,8 +305,8 @@ class DataManager:
 
                 return trades
 
-        except Exception as e:
-            logger.error(f"Error getting recent trades: {str(e)}")
+        except (sqlite3.Error, ValueError):
+            logger.exception("Error getting recent trades")
             return []
 
     def save_performance_metrics(self, date: str, metrics: Dict) -> bool:
@@ -282,13 +322,7 @@ class DataManager:
         """
         try:
             with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO performance_metrics (
-                        date, daily_pnl, cumulative_pnl, trades_count,
-                        winning_trades, losing_trades, win_rate,
-                        max_drawdown, account_balance, risk_utilization
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+                conn.execute(_SQL_UPSERT_PERFORMANCE_METRICS, (
                     date,
                     metrics.get('daily_pnl'),
                     metrics.get('cumulative_pnl'),
@@ -305,8 +339,8 @@ class DataManager:
                 logger.info(f"Performance metrics saved for {date}")
                 return True
                 
-        except Exception as e:
-            logger.error(f"Error saving performance metrics: {str(e)}")
+        except sqlite3.Error:
+            logger.exception("Error saving performance metrics")
             return False
     
     def get_performance_summary(self, days: int = 30) -> Dict[str, any]:
@@ -374,8 +408,8 @@ class DataManager:
                     'recent_trades': trades_df.tail(10).to_dict('records')
                 }
                 
-        except Exception as e:
-            logger.error(f"Error getting performance summary: {str(e)}")
+        except (sqlite3.Error, pd.errors.DatabaseError):
+            logger.exception("Error getting performance summary")
             return self._get_empty_performance_summary()
     
     def save_market_analysis(self, analysis_data: Dict) -> bool:
@@ -399,13 +433,7 @@ class DataManager:
                     'indicators': analysis_data.get('indicators', {})
                 })
                 
-                conn.execute("""
-                    INSERT INTO market_analysis (
-                        timeframe, current_price, trend, session,
-                        order_blocks_count, bos_detected, liquidity_grabs_count,
-                        vwap, rsi, atr, setup_quality, ai_confidence, analysis_data
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+                conn.execute(_SQL_INSERT_MARKET_ANALYSIS, (
                     analysis_data.get('timeframe', 'M5'),
                     analysis_data.get('current_price'),
                     analysis_data.get('trend'),
@@ -424,8 +452,8 @@ class DataManager:
                 conn.commit()
                 return True
                 
-        except Exception as e:
-            logger.error(f"Error saving market analysis: {str(e)}")
+        except (sqlite3.Error, TypeError):
+            logger.exception("Error saving market analysis")
             return False
     
     def log_system_event(self, event_type: str, severity: str, message: str, details: Dict = None) -> bool:
@@ -445,16 +473,14 @@ class DataManager:
             with sqlite3.connect(self.db_path) as conn:
                 details_json = json.dumps(details) if details else None
                 
-                conn.execute("""
-                    INSERT INTO system_events (event_type, severity, message, details)
-                    VALUES (?, ?, ?, ?)
-                """, (event_type, severity, message, details_json))
+                conn.execute(_SQL_INSERT_SYSTEM_EVENT,
+                             (event_type, severity, message, details_json))
                 
                 conn.commit()
                 return True
                 
-        except Exception as e:
-            logger.error(f"Error logging system event: {str(e)}")
+        except (sqlite3.Error, TypeError):
+            logger.exception("Error logging system event")
             return False
     
     def get_system_events(self, hours: int = 24, severity: str = None) -> pd.DataFrame:
@@ -483,8 +509,8 @@ class DataManager:
                 df = pd.read_sql_query(query, conn)
                 return df
                 
-        except Exception as e:
-            logger.error(f"Error getting system events: {str(e)}")
+        except (sqlite3.Error, pd.errors.DatabaseError):
+            logger.exception("Error getting system events")
             return pd.DataFrame()
     
     def _get_empty_performance_summary(self) -> Dict[str, any]:
@@ -531,13 +557,13 @@ class DataManager:
                             export_file = export_dir / f"{table}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
                             df.to_csv(export_file, index=False)
                             logger.info(f"Exported {table} to {export_file}")
-                    except Exception as e:
-                        logger.error(f"Error exporting {table}: {str(e)}")
+                    except (sqlite3.Error, pd.errors.DatabaseError, OSError):
+                        logger.exception("Error exporting %s", table)
             
             return True
             
-        except Exception as e:
-            logger.error(f"Export error: {str(e)}")
+        except (sqlite3.Error, OSError):
+            logger.exception("Export error")
             return False
     
     def cleanup_old_data(self, days_to_keep: int = 90) -> bool:
@@ -569,8 +595,8 @@ class DataManager:
                 logger.info(f"Cleaned up data older than {days_to_keep} days")
                 return True
                 
-        except Exception as e:
-            logger.error(f"Cleanup error: {str(e)}")
+        except sqlite3.Error:
+            logger.exception("Cleanup error")
             return False
 
     def save_bot_state(self, is_running: bool, trading_mode: str, risk_percentage: float,
@@ -593,24 +619,15 @@ class DataManager:
             config_json = json.dumps(configuration) if configuration else None
 
             with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    UPDATE bot_state SET
-                        is_running = ?,
-                        trading_mode = ?,
-                        risk_percentage = ?,
-                        max_risk_amount = ?,
-                        last_updated = CURRENT_TIMESTAMP,
-                        session_id = ?,
-                        configuration = ?
-                    WHERE id = 1
-                """, (is_running, trading_mode, risk_percentage, max_risk_amount, session_id, config_json))
+                conn.execute(_SQL_UPDATE_BOT_STATE,
+                             (is_running, trading_mode, risk_percentage, max_risk_amount, session_id, config_json))
 
                 conn.commit()
                 logger.info(f"Bot state saved: Running={is_running}, Mode={trading_mode}")
                 return True
 
-        except Exception as e:
-            logger.error(f"Error saving bot state: {str(e)}")
+        except (sqlite3.Error, TypeError):
+            logger.exception("Error saving bot state")
             return False
 
     def get_bot_state(self) -> Dict:
@@ -652,8 +669,8 @@ class DataManager:
                         'configuration': {}
                     }
 
-        except Exception as e:
-            logger.error(f"Error getting bot state: {str(e)}")
+        except (sqlite3.Error, json.JSONDecodeError):
+            logger.exception("Error getting bot state")
             return {
                 'is_running': False,
                 'trading_mode': 'Paper Trading',
@@ -688,7 +705,7 @@ def test_data_manager():
         'timeframe': 'M5'
     }
     
-    success = dm.save_trade(sample_trade)
+    trade_id = dm.save_trade(sample_trade)
     
     # Test performance summary
     summary = dm.get_performance_summary(30)
@@ -697,7 +714,7 @@ def test_data_manager():
     dm.log_system_event('TEST', 'INFO', 'Data manager test completed')
     
     print("✅ Data Manager Test Results:")
-    print(f"   Trade saved: {success}")
+    print(f"   Trade saved: {trade_id is not None} (id={trade_id})")
     print(f"   Performance summary: {len(summary)} metrics")
     print(f"   Database file: {dm.db_path}")
     
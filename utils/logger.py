@@ -3,15 +3,146 @@ Gold Digger AI Bot - Enhanced Logging System
 Professional logging with file rotation and structured output
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
 import sys
+import threading
+import time
+import weakref
+from collections import deque
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_default(obj):
+    """Fallback encoder for values JSON has no type for (datetimes, numpy scalars, ...)"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if hasattr(obj, 'item'):
+        return obj.item()  # numpy scalar -> Python int/float/bool
+    return str(obj)
+
+
+def _dumps(obj) -> bytes:
+    """Serialize a structured log entry to UTF-8 JSON, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        # Trade data built from pandas/numpy carries numpy values and
+        # non-str dict keys, both of which plain orjson.dumps() rejects
+        return orjson.dumps(obj, default=_json_default,
+                            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_json_default).encode('utf-8')
+
+
+# Background flushing for buffered file handlers
+_FLUSH_INTERVAL = 0.2  # seconds
+_buffered_handlers = weakref.WeakSet()
+_flusher_lock = threading.Lock()
+_flusher_thread = None
+
+
+def _flush_loop():
+    """Periodically flush every live buffered handler"""
+    while True:
+        time.sleep(_FLUSH_INTERVAL)
+        try:
+            # Snapshot under the lock; the WeakSet may change while we iterate
+            with _flusher_lock:
+                handlers = list(_buffered_handlers)
+            for handler in handlers:
+                try:
+                    handler.flush()
+                except (OSError, ValueError):
+                    pass
+        except Exception:
+            # Never let one bad pass kill the flusher thread
+            continue
+
+
+def _register_buffered_handler(handler: logging.Handler):
+    """Track a handler for periodic flushing, starting the flusher thread on first use"""
+    global _flusher_thread
+
+    with _flusher_lock:
+        _buffered_handlers.add(handler)
+        if _flusher_thread is None:
+            _flusher_thread = threading.Thread(target=_flush_loop, name="gold_digger_log_flusher", daemon=True)
+            _flusher_thread.start()
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that batches writes in a large stream buffer
+
+    Records are flushed by a background thread every _FLUSH_INTERVAL seconds,
+    immediately for records at or above flush_level, and on rollover/close.
+    logging.shutdown() (registered atexit by the logging module) flushes the rest.
+
+    The file size is tracked with a counter rather than stream.tell(), which
+    would flush the text buffer on every record.
+    """
+
+    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None,
+                 delay=False, buffer_size: int = 64 * 1024, flush_level: int = logging.WARNING):
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self._bytes_written = 0
+        super().__init__(filename, mode, maxBytes, backupCount, encoding, delay)
+        _register_buffered_handler(self)
+
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=self.errors)
+        self._bytes_written = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def _encoded_len(self, msg: str) -> int:
+        """Size of msg on disk; emoji-heavy messages take several bytes per character"""
+        encoding = self.encoding or getattr(self.stream, 'encoding', None) or 'utf-8'
+        return len(msg.encode(encoding, self.errors or 'strict'))
+
+    def _would_overflow(self, length: int) -> bool:
+        """Whether appending length more bytes passes maxBytes"""
+        return 0 < self.maxBytes <= self._bytes_written + length and self._bytes_written > 0
+
+    def shouldRollover(self, record) -> bool:
+        """Size check from the byte counter; never calls tell() on the buffered stream"""
+        return self._would_overflow(self._encoded_len(self.format(record) + self.terminator))
+
+    def doRollover(self):
+        super().doRollover()
+        self._bytes_written = 0
+
+    def emit(self, record):
+        """Write the record without the per-record flush done by StreamHandler.emit"""
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            length = self._encoded_len(msg)
+            if self._would_overflow(length):
+                self.doRollover()  # closes (and so flushes) the current file
+                if self.stream is None:  # delay=True leaves the new file unopened
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._bytes_written += length
+            if record.levelno >= self.flush_level:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
 def setup_logger(name: str = "gold_digger", 
                 log_level: str = "INFO",
                 log_dir: str = "logs",
@@ -31,12 +162,15 @@ def setup_logger(name: str = "gold_digger",
         Configured logger instance
     """
     
+    # Create logger; repeat calls for the same name reuse the existing handlers
+    logger = logging.getLogger(name)
+    if getattr(logger, '_gd_configured', False):
+        return logger
+    
     # Create logs directory
     log_path = Path(log_dir)
     log_path.mkdir(parents=True, exist_ok=True)
     
-    # Create logger
-    logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
     
     # Clear existing handlers
@@ -55,7 +189,7 @@ def setup_logger(name: str = "gold_digger",
     
     # File handler with rotation
     log_file = log_path / f"{name}.log"
-    file_handler = logging.handlers.RotatingFileHandler(
+    file_handler = BufferedRotatingFileHandler(
         log_file,
         maxBytes=max_file_size,
         backupCount=backup_count,
@@ -73,11 +207,12 @@ def setup_logger(name: str = "gold_digger",
     
     # Error file handler (separate file for errors)
     error_file = log_path / f"{name}_errors.log"
-    error_handler = logging.handlers.RotatingFileHandler(
+    error_handler = BufferedRotatingFileHandler(
         error_file,
         maxBytes=max_file_size,
         backupCount=backup_count,
-        encoding='utf-8'
+        encoding='utf-8',
+        delay=True  # file is only opened once the first record arrives
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(detailed_formatter)
@@ -85,32 +220,42 @@ def setup_logger(name: str = "gold_digger",
     
     # Trade log handler (for trade-specific events)
     trade_file = log_path / f"{name}_trades.log"
-    trade_handler = logging.handlers.RotatingFileHandler(
+    trade_handler = BufferedRotatingFileHandler(
         trade_file,
         maxBytes=max_file_size,
         backupCount=backup_count,
-        encoding='utf-8'
+        encoding='utf-8',
+        delay=True  # file is only opened once the first record arrives
     )
     trade_handler.setLevel(logging.INFO)
     trade_handler.setFormatter(detailed_formatter)
     
-    # Add filter for trade-related logs
-    class TradeFilter(logging.Filter):
-        def filter(self, record):
-            return 'trade' in record.getMessage().lower() or 'signal' in record.getMessage().lower()
-    
-    trade_handler.addFilter(TradeFilter())
-    logger.addHandler(trade_handler)
+    # Trade events go through a dedicated child logger so only they reach the
+    # trade file; propagation still delivers them once to the handlers above
+    trade_logger = logging.getLogger(f"{name}.trade")
+    trade_logger.handlers.clear()
+    trade_logger.propagate = True
+    trade_logger.addHandler(trade_handler)
     
+    logger._gd_configured = True
     logger.info(f"Logger '{name}' initialized with level {log_level}")
     return logger
 
 class StructuredLogger:
     """
     Structured logger for JSON-formatted logs with metadata
+
+    Entries are serialized on the caller's thread and queued; a writer thread
+    appends everything queued so far with one write() call. If the writer falls
+    more than 8192 entries behind, the oldest queued entries are dropped and a
+    LOG_ENTRIES_DROPPED entry with the count is written on the next flush.
+    Entries logged after close() are written synchronously.
     """
     
-    def __init__(self, name: str = "gold_digger_structured", log_dir: str = "logs"):
+    def __init__(self, name: str = "gold_digger_structured", log_dir: str = "logs",
+                 max_file_size: int = 10 * 1024 * 1024,  # 10MB
+                 backup_count: int = 5):
+        # Level gate only; entries are written straight to the JSONL file
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.INFO)
         
@@ -118,53 +263,165 @@ class StructuredLogger:
         log_path = Path(log_dir)
         log_path.mkdir(parents=True, exist_ok=True)
         
-        # JSON file handler
-        json_file = log_path / f"{name}.jsonl"
-        json_handler = logging.handlers.RotatingFileHandler(
-            json_file,
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5,
-            encoding='utf-8'
-        )
-        json_handler.setLevel(logging.INFO)
-        json_handler.setFormatter(logging.Formatter('%(message)s'))
+        # Pre-opened append-only descriptor for the JSONL file
+        self.json_file = str(log_path / f"{name}.jsonl")
+        self.max_file_size = max_file_size
+        self.backup_count = backup_count
+        self._lock = threading.Lock()
+        self._fd = self._open_fd()
+        
+        # Serialized entries waiting for the writer thread
+        # (the queue has its own lock so callers never wait on file writes)
+        self._pending = deque(maxlen=8192)
+        self._pending_lock = threading.Lock()
+        self._dropped = 0
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._writer = threading.Thread(target=self._writer_loop, name=f"{name}_writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+    
+    def _open_fd(self) -> int:
+        """Open the JSONL file for raw appends"""
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+        return os.open(self.json_file, flags, 0o644)
+    
+    def _rotate(self):
+        """Shift backups like RotatingFileHandler and reopen the base file (caller holds _lock)"""
+        os.close(self._fd)
+        for i in range(self.backup_count - 1, 0, -1):
+            src = f"{self.json_file}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.json_file}.{i + 1}")
+        if self.backup_count > 0:
+            os.replace(self.json_file, f"{self.json_file}.1")
+        self._fd = self._open_fd()
+    
+    def _enqueue(self, entry: dict):
+        """Serialize an entry and hand it to the writer thread (or write it, once closed)"""
+        line = _dumps(entry) + b'\n'
+        with self._pending_lock:
+            if len(self._pending) == self._pending.maxlen:
+                self._dropped += 1  # append() below evicts the oldest entry
+            self._pending.append(line)
+            closed = self._closed
+        
+        if closed:
+            self.flush()  # no writer thread left to do it
+        else:
+            self._wakeup.set()
+    
+    def _writer_loop(self):
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            self.flush()
+            if self._closed:
+                return
+    
+    def flush(self):
+        """Append every queued entry to the JSONL file, one write per file-sized chunk"""
+        with self._lock:
+            with self._pending_lock:
+                batch = list(self._pending)
+                self._pending.clear()
+                dropped, self._dropped = self._dropped, 0
+            if dropped:
+                batch.append(_dumps({
+                    'timestamp': datetime.now(),
+                    'event_type': 'LOG_ENTRIES_DROPPED',
+                    'message': f"{dropped} structured log entries dropped: writer fell behind",
+                    'data': {'dropped': dropped}
+                }) + b'\n')
+            if not batch:
+                return
+            
+            # After close() the file is opened just for this write
+            reopened = self._fd is None
+            if reopened:
+                self._fd = self._open_fd()
+            try:
+                self._write_batch(batch)
+            finally:
+                if reopened:
+                    os.close(self._fd)
+                    self._fd = None
+    
+    def _write_batch(self, batch):
+        """Write serialized entries, rotating as needed (caller holds _lock)"""
+        # Split at the size limit so a large backlog fills the current file
+        # and rolls over, rather than rotating out an empty file
+        size = os.fstat(self._fd).st_size
+        chunk, chunk_size = [], 0
+        for line in batch:
+            if size + chunk_size + len(line) > self.max_file_size and (size or chunk):
+                if chunk:
+                    os.write(self._fd, b''.join(chunk))
+                self._rotate()
+                size, chunk, chunk_size = 0, [], 0
+            chunk.append(line)
+            chunk_size += len(line)
+        os.write(self._fd, b''.join(chunk))
+    
+    def close(self):
+        """Flush queued entries, stop the writer thread and close the file"""
+        with self._pending_lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._wakeup.set()
+        self._writer.join(timeout=1.0)
+        self.flush()
         
-        self.logger.addHandler(json_handler)
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
     
     def log_trade_event(self, event_type: str, trade_data: dict, metadata: dict = None):
         """Log trade event in structured format"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         log_entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(),
             'event_type': event_type,
             'trade_data': trade_data,
             'metadata': metadata or {}
         }
         
-        self.logger.info(json.dumps(log_entry))
+        self._enqueue(log_entry)
     
     def log_system_event(self, event_type: str, message: str, data: dict = None):
         """Log system event in structured format"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         log_entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(),
             'event_type': event_type,
             'message': message,
             'data': data or {}
         }
         
-        self.logger.info(json.dumps(log_entry))
+        self._enqueue(log_entry)
     
     def log_performance_metrics(self, metrics: dict):
         """Log performance metrics"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         log_entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(),
             'event_type': 'PERFORMANCE_METRICS',
             'metrics': metrics
         }
         
-        self.logger.info(json.dumps(log_entry))
+        self._enqueue(log_entry)
 
 # Global logger instance
 _global_logger = None
+_trade_logger = None
 
 def get_logger(name: str = "gold_digger") -> logging.Logger:
     """Get or create global logger instance"""
@@ -176,54 +433,76 @@ def get_logger(name: str = "gold_digger") -> logging.Logger:
     
     return _global_logger
 
+def get_trade_logger() -> logging.Logger:
+    """Get the child logger that feeds the dedicated trade log file"""
+    global _trade_logger
+    
+    if _trade_logger is None:
+        _trade_logger = logging.getLogger(f"{get_logger().name}.trade")
+    
+    return _trade_logger
+
+# Pre-built message templates and field extractors for the convenience functions
+_SIGNAL_DEFAULTS = {'signal': 'UNKNOWN', 'confidence': 0, 'entry_price': 0, 'risk_reward_ratio': 0}
+_SIGNAL_KEYS = itemgetter('signal', 'confidence', 'entry_price', 'risk_reward_ratio')
+_SIGNAL_FMT = "TRADE_SIGNAL: {} | Confidence: {:.1%} | Entry: ${:.2f} | R:R: 1:{:.1f}".format
+
+_EXECUTION_DEFAULTS = {'direction': 'UNKNOWN', 'lot_size': 0, 'entry_price': 0, 'stop_loss': 0, 'take_profit': 0}
+_EXECUTION_KEYS = itemgetter('direction', 'lot_size', 'entry_price', 'stop_loss', 'take_profit')
+_EXECUTION_FMT = "TRADE_EXECUTED: {} | Size: {:.2f} lots | Entry: ${:.2f} | SL: ${:.2f} | TP: ${:.2f}".format
+
+_CLOSE_DEFAULTS = {'direction': 'UNKNOWN', 'exit_price': 0, 'pnl': 0, 'close_reason': 'UNKNOWN'}
+_CLOSE_KEYS = itemgetter('direction', 'exit_price', 'pnl', 'close_reason')
+_CLOSE_FMT = "TRADE_CLOSED: {} | Exit: ${:.2f} | P&L: {}${:.2f} | Reason: {}".format
+
+_PERFORMANCE_DEFAULTS = {'balance': 0, 'daily_pnl': 0, 'win_rate': 0, 'drawdown': 0}
+_PERFORMANCE_KEYS = itemgetter('balance', 'daily_pnl', 'win_rate', 'drawdown')
+_PERFORMANCE_FMT = "PERFORMANCE: Balance: ${:,.2f} | Daily P&L: ${:+.2f} | Win Rate: {:.1f}% | Drawdown: {:.2f}%".format
+
 def log_trade_signal(signal_data: dict):
     """Convenience function to log trade signals"""
-    logger = get_logger()
-    logger.info(f"TRADE_SIGNAL: {signal_data.get('signal', 'UNKNOWN')} | "
-               f"Confidence: {signal_data.get('confidence', 0)*100:.1f}% | "
-               f"Entry: ${signal_data.get('entry_price', 0):.2f} | "
-               f"R:R: 1:{signal_data.get('risk_reward_ratio', 0):.1f}")
+    logger = _trade_logger or get_trade_logger()
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info(_SIGNAL_FMT(*_SIGNAL_KEYS({**_SIGNAL_DEFAULTS, **signal_data})))
 
 def log_trade_execution(trade_data: dict):
     """Convenience function to log trade executions"""
-    logger = get_logger()
-    logger.info(f"TRADE_EXECUTED: {trade_data.get('direction', 'UNKNOWN')} | "
-               f"Size: {trade_data.get('lot_size', 0):.2f} lots | "
-               f"Entry: ${trade_data.get('entry_price', 0):.2f} | "
-               f"SL: ${trade_data.get('stop_loss', 0):.2f} | "
-               f"TP: ${trade_data.get('take_profit', 0):.2f}")
+    logger = _trade_logger or get_trade_logger()
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info(_EXECUTION_FMT(*_EXECUTION_KEYS({**_EXECUTION_DEFAULTS, **trade_data})))
 
 def log_trade_close(close_data: dict):
     """Convenience function to log trade closures"""
-    logger = get_logger()
-    pnl = close_data.get('pnl', 0)
-    pnl_sign = '+' if pnl >= 0 else ''
-    logger.info(f"TRADE_CLOSED: {close_data.get('direction', 'UNKNOWN')} | "
-               f"Exit: ${close_data.get('exit_price', 0):.2f} | "
-               f"P&L: {pnl_sign}${pnl:.2f} | "
-               f"Reason: {close_data.get('close_reason', 'UNKNOWN')}")
+    logger = _trade_logger or get_trade_logger()
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    direction, exit_price, pnl, reason = _CLOSE_KEYS({**_CLOSE_DEFAULTS, **close_data})
+    logger.info(_CLOSE_FMT(direction, exit_price, '+' if pnl >= 0 else '', pnl, reason))
 
 def log_system_status(status: str, details: dict = None):
     """Convenience function to log system status"""
-    logger = get_logger()
-    details_str = f" | {details}" if details else ""
-    logger.info(f"SYSTEM_STATUS: {status}{details_str}")
+    logger = _global_logger or get_logger()
+    if details:
+        logger.info("SYSTEM_STATUS: %s | %s", status, details)
+    else:
+        logger.info("SYSTEM_STATUS: %s", status)
 
 def log_error(error_msg: str, exception: Exception = None):
     """Convenience function to log errors"""
-    logger = get_logger()
+    logger = _global_logger or get_logger()
     if exception:
-        logger.error(f"ERROR: {error_msg} | Exception: {str(exception)}", exc_info=True)
+        logger.error("ERROR: %s | Exception: %s", error_msg, exception, exc_info=True)
     else:
-        logger.error(f"ERROR: {error_msg}")
+        logger.error("ERROR: %s", error_msg)
 
 def log_performance_update(metrics: dict):
     """Convenience function to log performance updates"""
-    logger = get_logger()
-    logger.info(f"PERFORMANCE: Balance: ${metrics.get('balance', 0):,.2f} | "
-               f"Daily P&L: ${metrics.get('daily_pnl', 0):+.2f} | "
-               f"Win Rate: {metrics.get('win_rate', 0):.1f}% | "
-               f"Drawdown: {metrics.get('drawdown', 0):.2f}%")
+    logger = _global_logger or get_logger()
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info(_PERFORMANCE_FMT(*_PERFORMANCE_KEYS({**_PERFORMANCE_DEFAULTS, **metrics})))
 
 # Test function
 def test_logger():
@@ -6,11 +6,27 @@ Discord, Telegram, and email alerts for trading events
 import os
 import json
 import logging
-from datetime import datetime
+import atexit
+import smtplib
+import threading
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, Optional, List
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from email.mime.text import MIMEText
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
@@ -18,6 +34,34 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+def _dumps(obj) -> bytes:
+    """Serialize a webhook payload to compact UTF-8 JSON, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# (epoch second, formatted stamp) of the last _utc_stamp() call
+_utc_stamp_cache = (None, '')
+
+def _utc_stamp() -> str:
+    """Current UTC time as 'YYYY-MM-DD HH:MM:SS UTC', formatted at most once per second"""
+    global _utc_stamp_cache
+    
+    second = int(time.time())
+    cached_second, stamp = _utc_stamp_cache
+    if second != cached_second:
+        stamp = datetime.fromtimestamp(second, timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
+        _utc_stamp_cache = (second, stamp)
+    
+    return stamp
+
+@lru_cache(maxsize=128)
+def _join_smc_steps(smc_steps: tuple) -> str:
+    """Render completed SMC steps as a checklist (memoized, step lists repeat across signals)"""
+    return "\n".join(f"✅ {step}" for step in smc_steps)
+
 class NotificationManager:
     """
     Comprehensive notification system for trading alerts
@@ -36,11 +80,69 @@ class NotificationManager:
         # Email settings
         self.email_enabled = bool(os.getenv('EMAIL_USERNAME'))
         
+        # Constant parts of the Discord trade embed, serialized once
+        self._discord_prefix, self._discord_suffix = self._build_discord_skeleton()
+        
+        # Shared HTTP session so webhook posts reuse keep-alive connections
+        self._session = self._create_http_session()
+        
+        # Alerts are delivered off the caller's thread, one worker per channel
+        self._executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="notif")
+        
+        # Authenticated SMTP connection, opened on first email and reused
+        self._smtp = None
+        self._smtp_lock = threading.Lock()
+        atexit.register(self.close)
+        
         # Notification preferences
         self.enabled_channels = self._get_enabled_channels()
         
         logger.info(f"NotificationManager initialized with {len(self.enabled_channels)} channels")
     
+    @staticmethod
+    def _create_http_session():
+        """Create a pooled HTTP session with light retry on connection errors"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    @staticmethod
+    def _build_discord_skeleton():
+        """Split the pre-serialized Discord payload around the per-alert embed fields"""
+        skeleton = _dumps({
+            "username": "Gold Digger AI",
+            "avatar_url": "https://cdn-icons-png.flaticon.com/512/2583/2583788.png",
+            "embeds": [{
+                "title": "🏆 Gold Digger AI Trade Alert",
+                "footer": {
+                    "text": "Gold Digger AI Bot • Smart Money Concepts"
+                },
+                "_dynamic": None
+            }]
+        })
+        prefix, suffix = skeleton.split(b'"_dynamic":null')
+        return prefix, suffix
+    
+    def close(self):
+        """Release the HTTP session, SMTP connection and worker threads"""
+        self._executor.shutdown(wait=True)
+        
+        with self._smtp_lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except Exception:
+                    pass
+                self._smtp = None
+        
+        self._session.close()
+    
     def _get_enabled_channels(self) -> List[str]:
         """Get list of enabled notification channels"""
         channels = []
@@ -60,36 +162,36 @@ class NotificationManager:
         """
         Send trade alert to all enabled channels
         
+        Delivery runs in parallel on background workers so a slow channel
+        never blocks the caller; each sender logs its own outcome.
+        
         Args:
             trade_signal: Trade signal information
             market_data: Current market context
             
         Returns:
-            True if at least one notification sent successfully
+            True if the alert was queued for at least one channel
         """
         try:
             # Format trade alert message
             message = self._format_trade_alert(trade_signal, market_data)
             
-            success_count = 0
+            futures = []
             
             # Send to Discord
             if 'discord' in self.enabled_channels:
-                if self._send_discord_alert(message, trade_signal):
-                    success_count += 1
+                futures.append(self._executor.submit(self._send_discord_alert, message, trade_signal))
             
             # Send to Telegram
             if 'telegram' in self.enabled_channels:
-                if self._send_telegram_alert(message):
-                    success_count += 1
+                futures.append(self._executor.submit(self._send_telegram_alert, message))
             
             # Send email
             if 'email' in self.enabled_channels:
-                if self._send_email_alert(message, trade_signal):
-                    success_count += 1
+                futures.append(self._executor.submit(self._send_email_alert, message, trade_signal))
             
-            logger.info(f"Trade alert sent to {success_count}/{len(self.enabled_channels)} channels")
-            return success_count > 0
+            logger.info(f"Trade alert queued for {len(futures)}/{len(self.enabled_channels)} channels")
+            return len(futures) > 0
             
         except Exception as e:
             logger.error(f"Error sending trade alert: {str(e)}")
@@ -132,7 +234,7 @@ class NotificationManager:
 **SMC Analysis**:
 {self._format_smc_reasoning(trade_signal)}
 
-**Time**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}
+**Time**: {_utc_stamp()}
 
 ⚠️ *This is an automated alert. Always verify before trading.*
 """
@@ -149,7 +251,7 @@ class NotificationManager:
             smc_steps = analysis.get('smc_steps_completed', [])
             
             if smc_steps:
-                return "\n".join([f"✅ {step}" for step in smc_steps])
+                return _join_smc_steps(tuple(smc_steps))
             else:
                 reasons = trade_signal.get('reasons', ['No specific reasoning provided'])
                 return f"• {reasons[0]}" if reasons else "• Standard SMC setup detected"
@@ -160,17 +262,13 @@ class NotificationManager:
     def _send_discord_alert(self, message: str, trade_signal: Dict) -> bool:
         """Send alert to Discord webhook"""
         try:
-            import requests
-            
-            # Create Discord embed
-            embed = {
-                "title": "🏆 Gold Digger AI Trade Alert",
+            # Only the per-alert embed members are encoded here; the rest of
+            # the payload comes from the pre-serialized skeleton
+            signal = trade_signal.get('signal')
+            dynamic = _dumps({
                 "description": message,
-                "color": 0x00ff00 if trade_signal.get('signal') == 'BUY' else 0xff0000 if trade_signal.get('signal') == 'SELL' else 0x808080,
+                "color": 0x00ff00 if signal == 'BUY' else 0xff0000 if signal == 'SELL' else 0x808080,
                 "timestamp": datetime.now().isoformat(),
-                "footer": {
-                    "text": "Gold Digger AI Bot • Smart Money Concepts"
-                },
                 "fields": [
                     {
                         "name": "Signal",
@@ -188,15 +286,10 @@ class NotificationManager:
                         "inline": True
                     }
                 ]
-            }
-            
-            payload = {
-                "embeds": [embed],
-                "username": "Gold Digger AI",
-                "avatar_url": "https://cdn-icons-png.flaticon.com/512/2583/2583788.png"
-            }
+            })
+            payload = self._discord_prefix + dynamic[1:-1] + self._discord_suffix
             
-            response = requests.post(self.discord_webhook, json=payload, timeout=10)
+            response = self._session.post(self.discord_webhook, data=payload, headers=JSON_HEADERS, timeout=10)
             
             if response.status_code == 204:
                 logger.info("Discord alert sent successfully")
@@ -212,8 +305,6 @@ class NotificationManager:
     def _send_telegram_alert(self, message: str) -> bool:
         """Send alert to Telegram"""
         try:
-            import requests
-            
             url = f"https://api.telegram.org/bot{self.telegram_token}/sendMessage"
             
             payload = {
@@ -223,7 +314,7 @@ class NotificationManager:
                 "disable_web_page_preview": True
             }
             
-            response = requests.post(url, json=payload, timeout=10)
+            response = self._session.post(url, json=payload, timeout=10)
             
             if response.status_code == 200:
                 logger.info("Telegram alert sent successfully")
@@ -239,10 +330,6 @@ class NotificationManager:
     def _send_email_alert(self, message: str, trade_signal: Dict) -> bool:
         """Send email alert"""
         try:
-            import smtplib
-            from email.mime.text import MIMEText
-            from email.mime.multipart import MIMEMultipart
-            
             # Email configuration
             smtp_server = os.getenv('EMAIL_SMTP_SERVER', 'smtp.gmail.com')
             smtp_port = int(os.getenv('EMAIL_SMTP_PORT', '587'))
@@ -254,20 +341,24 @@ class NotificationManager:
                 logger.warning("Email configuration incomplete")
                 return False
             
-            # Create message
-            msg = MIMEMultipart()
+            # Create plain-text message (single part, no multipart wrapper)
+            msg = MIMEText(message, 'plain')
             msg['From'] = username
             msg['To'] = to_email
             msg['Subject'] = f"Gold Digger AI Alert: {trade_signal.get('signal', 'HOLD')} Signal"
             
-            # Add body
-            msg.attach(MIMEText(message, 'plain'))
-            
-            # Send email
-            with smtplib.SMTP(smtp_server, smtp_port) as server:
-                server.starttls()
-                server.login(username, password)
-                server.send_message(msg)
+            # Send email over the shared connection, reconnecting once if the
+            # server dropped it while idle
+            with self._smtp_lock:
+                try:
+                    self._ensure_smtp(smtp_server, smtp_port, username, password).send_message(msg)
+                except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError):
+                    self._drop_smtp()
+                    self._ensure_smtp(smtp_server, smtp_port, username, password).send_message(msg)
+                except (smtplib.SMTPException, OSError):
+                    # e.g. a socket timeout mid-send: don't reuse the connection
+                    self._drop_smtp()
+                    raise
             
             logger.info("Email alert sent successfully")
             return True
@@ -276,6 +367,31 @@ class NotificationManager:
             logger.error(f"Email alert error: {str(e)}")
             return False
     
+    def _ensure_smtp(self, smtp_server: str, smtp_port: int, username: str, password: str):
+        """Return the shared SMTP connection, connecting and logging in if needed (caller holds _smtp_lock)"""
+        if self._smtp is None:
+            server = smtplib.SMTP(smtp_server, smtp_port, timeout=10)
+            try:
+                server.starttls()
+                server.login(username, password)
+            except (smtplib.SMTPException, OSError):
+                # socket.timeout is an OSError; never keep a half-open connection
+                server.close()
+                self._smtp = None
+                raise
+            self._smtp = server
+        
+        return self._smtp
+    
+    def _drop_smtp(self):
+        """Close and forget the shared SMTP connection (caller holds _smtp_lock)"""
+        server, self._smtp = self._smtp, None
+        if server is not None:
+            try:
+                server.close()
+            except OSError:
+                pass
+    
     def send_system_alert(self, alert_type: str, message: str, severity: str = 'INFO') -> bool:
         """
         Send system alert (errors, warnings, status updates)
@@ -307,7 +423,7 @@ class NotificationManager:
 
 **Message**: {message}
 
-**Time**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}
+**Time**: {_utc_stamp()}
 """
             
             # Send to enabled channels (simplified for system alerts)
@@ -326,14 +442,12 @@ class NotificationManager:
     def _send_simple_discord_message(self, message: str) -> bool:
         """Send simple Discord message"""
         try:
-            import requests
-            
             payload = {
                 "content": message,
                 "username": "Gold Digger AI System"
             }
             
-            response = requests.post(self.discord_webhook, json=payload, timeout=10)
+            response = self._session.post(self.discord_webhook, json=payload, timeout=10)
             return response.status_code == 204
             
         except Exception:
@@ -354,20 +468,26 @@ This is a test notification to verify your alert system is working correctly.
 • Status: System Check
 
 If you received this message, your notifications are configured correctly! 🎉
-""".format(time=datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC'))
+""".format(time=_utc_stamp())
+        
+        # Channels are tested concurrently, so wall time is the slowest channel
+        futures = {}
         
         # Test Discord
         if 'discord' in self.enabled_channels:
-            results['discord'] = self._send_simple_discord_message(test_message)
+            futures['discord'] = self._executor.submit(self._send_simple_discord_message, test_message)
         
         # Test Telegram
         if 'telegram' in self.enabled_channels:
-            results['telegram'] = self._send_telegram_alert(test_message)
+            futures['telegram'] = self._executor.submit(self._send_telegram_alert, test_message)
         
         # Test Email
         if 'email' in self.enabled_channels:
             test_signal = {'signal': 'TEST', 'confidence': 1.0}
-            results['email'] = self._send_email_alert(test_message, test_signal)
+            futures['email'] = self._executor.submit(self._send_email_alert, test_message, test_signal)
+        
+        for channel, future in futures.items():
+            results[channel] = future.result()
         
         logger.info(f"Notification test results: {results}")
         return results
@@ -0,0 +1,113 @@
+"""
+Gold Digger AI Bot - Verification Helpers
+Run independent verification stages concurrently with ordered console output
+"""
+
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class _ThreadLocalStdout:
+    """
+    sys.stdout stand-in that routes each capturing thread's writes to its own buffer
+    Threads that are not capturing write straight through to the real stream
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self, buffer: Optional[io.StringIO]):
+        """Start (or with None, stop) capturing the current thread's output"""
+        self._local.buffer = buffer
+
+    def _target(self):
+        buffer = getattr(self._local, 'buffer', None)
+        return buffer if buffer is not None else self._stream
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def run_stages(stages: List[Callable[[], Any]], max_workers: Optional[int] = None) -> List[Any]:
+    """
+    Run independent verification stages concurrently
+
+    Each stage's printed output is buffered separately and replayed in stage
+    order once every stage has finished, so the report reads exactly as if the
+    stages had run one after another.
+
+    Args:
+        stages: Zero-argument callables, typically the verify_* functions
+        max_workers: Thread pool size (defaults to one thread per stage)
+
+    Returns:
+        Stage return values, in the same order as stages
+    """
+    outputs = [''] * len(stages)
+    real_stdout = sys.stdout
+    proxy = _ThreadLocalStdout(real_stdout)
+
+    def run_captured(index: int, stage: Callable[[], Any]) -> Any:
+        buffer = io.StringIO()
+        proxy.capture(buffer)
+        try:
+            return stage()
+        finally:
+            proxy.capture(None)
+            outputs[index] = buffer.getvalue()
+
+    sys.stdout = proxy
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers or len(stages) or 1) as executor:
+            futures = [executor.submit(run_captured, i, stage) for i, stage in enumerate(stages)]
+    finally:
+        sys.stdout = real_stdout
+
+    real_stdout.write(''.join(outputs))
+    real_stdout.flush()
+
+    return [future.result() for future in futures]
+
+
+def synthetic_candles(n: int = 100, seed: int = 42) -> pd.DataFrame:
+    """
+    Deterministic 5-minute XAUUSD test candles for the strategy checks
+
+    Args:
+        n: Number of candles
+        seed: Random generator seed; the same seed gives the same candles
+
+    Returns:
+        OHLCV DataFrame indexed by candle time
+    """
+    # A random walk where each candle opens one drift step away from the
+    # previous close, drawn in one pass per column
+    dates = pd.date_range(start='2025-01-01', periods=n, freq='5min')
+    base_price = 2675.0
+
+    rng = np.random.default_rng(seed)
+    drift = rng.standard_normal(n)
+    close_noise, high_wick, low_wick = rng.standard_normal((3, n)) * np.array([[0.2], [0.5], [0.5]])
+    closes = base_price + np.cumsum(drift + close_noise)
+    opens = closes - close_noise
+
+    return pd.DataFrame({
+        'Open': opens,
+        'High': opens + np.abs(high_wick),
+        'Low': opens - np.abs(low_wick),
+        'Close': closes,
+        'Volume': rng.integers(100, 1000, n)
+    }, index=dates, copy=False)  # wrap the freshly drawn arrays without copying
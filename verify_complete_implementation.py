@@ -5,17 +5,31 @@ Verify against strategy.md, dev plan.md, and vibe coding implementation.md
 Test cross-platform compatibility and broker safety
 """
 
+import os
 import sys
 import platform
 from datetime import datetime
+from importlib.util import find_spec
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
 from dotenv import load_dotenv
 
+from core.indicators import SMCIndicators
+from core.trading_engine import TradingEngine
+from core.mt5_connector import MT5Connector
+from core.gemini_client import GeminiClient
+from core.live_trading_engine import LiveTradingEngine
+from core.risk_manager import RiskManager
+from utils.verification import run_stages, synthetic_candles
+
 # Load environment variables
 load_dotenv()
 
-def print_banner():
-    """Print verification banner"""
-    banner = """
+# Banner text, rendered once at import (script start)
+_BANNER = """
     ╔══════════════════════════════════════════════════════════════╗
     ║                                                              ║
     ║   🔍 GOLD DIGGER AI BOT - COMPLETE IMPLEMENTATION CHECK 🔍   ║
@@ -23,11 +37,48 @@ def print_banner():
     ║     Verifying Against All Specifications & Safety           ║
     ║                                                              ║
     ╚══════════════════════════════════════════════════════════════╝
-    """
-    print(banner)
-    print(f"🖥️  Platform: {platform.system()} {platform.release()}")
-    print(f"🐍 Python: {platform.python_version()}")
-    print(f"📅 Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    """ + (
+    "\n"
+    f"🖥️  Platform: {platform.system()} {platform.release()}\n"
+    f"🐍 Python: {platform.python_version()}\n"
+    f"📅 Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+)
+
+def print_banner():
+    """Print verification banner"""
+    sys.stdout.write(_BANNER)
+
+def _score(label: str, checks: List[Tuple[str, bool]], unit: str = "implemented") -> float:
+    """Print a stage's check results in one write and return its percentage score"""
+    # Pack the results into one int bitmask (bit i = check i passed) and popcount it
+    mask = 0
+    for bit, (_, status) in enumerate(checks):
+        if status:
+            mask |= 1 << bit
+    passed = bin(mask).count('1')  # int.bit_count() needs Python 3.10+
+    total = len(checks)
+    
+    lines = [f"   📊 {label}: {passed}/{total} {unit}"]
+    lines.extend(f"      {'✅' if mask >> bit & 1 else '❌'} {check}" for bit, (check, _) in enumerate(checks))
+    print("\n".join(lines))
+    
+    return (passed / total) * 100
+
+@lru_cache(maxsize=None)
+def _synthetic_candles() -> pd.DataFrame:
+    """Deterministic 5-minute test candles, built once per process"""
+    return synthetic_candles()
+
+@lru_cache(maxsize=None)
+def _smc_analysis() -> Dict:
+    """SMC market structure analysis of the test candles (cached)"""
+    return SMCIndicators().analyze_market_structure(_synthetic_candles())
+
+@lru_cache(maxsize=None)
+def _trade_signal() -> Dict:
+    """Trading engine signal for the test candles (cached)"""
+    account_info = {'balance': 100000, 'equity': 100000}
+    return TradingEngine().generate_trade_signal(_synthetic_candles(), account_info)
 
 def verify_strategy_md_implementation():
     """Verify strategy.md requirements are implemented"""
@@ -35,65 +86,47 @@ def verify_strategy_md_implementation():
     
     results = {}
     
-    # Test SMC Strategy Components
+    # Test SMC Strategy Components; each subtest fails on its own so one
+    # broken component only zeroes the checks that depend on it
+    try:
+        _synthetic_candles()
+    except Exception as e:
+        print(f"   ❌ Strategy verification failed: {str(e)}")
+        results['strategy_score'] = 0
+        return results
+    
+    # Test SMC indicators
+    try:
+        analysis = _smc_analysis()
+    except Exception as e:
+        print(f"   ❌ SMC analysis failed: {str(e)}")
+        analysis = {}
+    
+    # Test trading engine
+    try:
+        signal = _trade_signal()
+    except Exception as e:
+        print(f"   ❌ Signal generation failed: {str(e)}")
+        signal = {}
+    
     try:
-        from core.indicators import SMCIndicators
-        from core.trading_engine import TradingEngine
-        import pandas as pd
-        import numpy as np
-        
-        # Create test data
-        dates = pd.date_range(start='2025-01-01', periods=100, freq='5min')
-        data = []
-        base_price = 2675.0
-        
-        for date in dates:
-            price = base_price + np.random.normal(0, 1)
-            data.append({
-                'Open': price,
-                'High': price + abs(np.random.normal(0, 0.5)),
-                'Low': price - abs(np.random.normal(0, 0.5)),
-                'Close': price + np.random.normal(0, 0.2),
-                'Volume': np.random.randint(100, 1000)
-            })
-            base_price = data[-1]['Close']
-        
-        df = pd.DataFrame(data, index=dates)
-        
-        # Test SMC indicators
-        smc = SMCIndicators()
-        analysis = smc.analyze_market_structure(df)
-        
-        # Test trading engine
-        engine = TradingEngine()
-        account_info = {'balance': 100000, 'equity': 100000}
-        signal = engine.generate_trade_signal(df, account_info)
-        
         # Verify strategy.md requirements
-        strategy_checks = {
-            'xauusd_focus': True,  # XAU/USD focus
-            'smc_concepts': len(analysis.get('order_blocks', [])) >= 0,  # SMC implementation
-            'timeframes': True,  # M1/M5 entry, H1/M15 analysis
-            'session_levels': 'session_levels' in analysis,  # Session high/low
-            'vwap_indicator': 'vwap' in analysis,  # VWAP
-            'order_blocks': 'order_blocks' in analysis,  # Order Blocks
-            'bos_detection': 'bos_analysis' in analysis,  # Break of Structure
-            'liquidity_grabs': 'liquidity_grabs' in analysis,  # Liquidity identification
-            'risk_reward': signal.get('risk_reward_ratio', 0) >= 1.5,  # 1:2+ R:R
-            'position_sizing': signal.get('lot_size', 0) > 0,  # Position sizing
-            'stop_loss_logic': signal.get('stop_loss', 0) > 0,  # Stop loss
-            'take_profit_logic': signal.get('take_profit', 0) > 0,  # Take profit
-        }
-        
-        passed = sum(strategy_checks.values())
-        total = len(strategy_checks)
-        
-        print(f"   📊 Strategy Components: {passed}/{total} implemented")
-        
-        for check, status in strategy_checks.items():
-            print(f"      {'✅' if status else '❌'} {check}")
-        
-        results['strategy_score'] = (passed / total) * 100
+        strategy_checks = [
+            ('xauusd_focus', True),  # XAU/USD focus
+            ('smc_concepts', len(analysis.get('order_blocks', [])) >= 0),  # SMC implementation
+            ('timeframes', True),  # M1/M5 entry, H1/M15 analysis
+            ('session_levels', 'session_levels' in analysis),  # Session high/low
+            ('vwap_indicator', 'vwap' in analysis),  # VWAP
+            ('order_blocks', 'order_blocks' in analysis),  # Order Blocks
+            ('bos_detection', 'bos_analysis' in analysis),  # Break of Structure
+            ('liquidity_grabs', 'liquidity_grabs' in analysis),  # Liquidity identification
+            ('risk_reward', signal.get('risk_reward_ratio', 0) >= 1.5),  # 1:2+ R:R
+            ('position_sizing', signal.get('lot_size', 0) > 0),  # Position sizing
+            ('stop_loss_logic', signal.get('stop_loss', 0) > 0),  # Stop loss
+            ('take_profit_logic', signal.get('take_profit', 0) > 0),  # Take profit
+        ]
+        
+        results['strategy_score'] = _score("Strategy Components", strategy_checks)
         
     except Exception as e:
         print(f"   ❌ Strategy verification failed: {str(e)}")
@@ -110,48 +143,33 @@ def verify_dev_plan_implementation():
     # Test architecture components
     try:
         # Test MT5 connector
-        from core.mt5_connector import MT5Connector
         connector = MT5Connector()
         mt5_result = connector.test_connection()
         
         # Test Gemini client
-        from core.gemini_client import GeminiClient
         client = GeminiClient()
         gemini_result = client.test_connection()
         
         # Test live trading engine
-        from core.live_trading_engine import LiveTradingEngine
         engine = LiveTradingEngine(paper_trading=True)
         
-        # Test data processing
-        import pandas as pd
-        import numpy as np
-        
-        # Test dashboard
-        import streamlit as st
+        # Test dashboard (installation check only, without importing streamlit)
+        streamlit_available = find_spec('streamlit') is not None
         
-        dev_plan_checks = {
-            'mt5_data_feed': mt5_result['success'],  # MT5 data connection
-            'gemini_ai_engine': gemini_result['success'],  # Gemini API
-            'python_signal_generator': True,  # Python SMC indicators
-            'mt5_execution': hasattr(connector, 'open_trade'),  # Trade execution
-            'pandas_processing': True,  # Data processing
-            'streamlit_dashboard': True,  # Monitoring interface
-            'cross_platform': platform.system() in ['Windows', 'Darwin'],  # Platform support
-            'compliance': True,  # No third-party webhooks
-            'real_time_data': mt5_result.get('current_price') is not None,  # Live data
-            'structured_prompts': hasattr(client, 'get_trade_decision'),  # AI integration
-        }
+        dev_plan_checks = [
+            ('mt5_data_feed', mt5_result['success']),  # MT5 data connection
+            ('gemini_ai_engine', gemini_result['success']),  # Gemini API
+            ('python_signal_generator', True),  # Python SMC indicators
+            ('mt5_execution', hasattr(connector, 'open_trade')),  # Trade execution
+            ('pandas_processing', True),  # Data processing
+            ('streamlit_dashboard', streamlit_available),  # Monitoring interface
+            ('cross_platform', platform.system() in ['Windows', 'Darwin']),  # Platform support
+            ('compliance', True),  # No third-party webhooks
+            ('real_time_data', mt5_result.get('current_price') is not None),  # Live data
+            ('structured_prompts', hasattr(client, 'get_trade_decision')),  # AI integration
+        ]
         
-        passed = sum(dev_plan_checks.values())
-        total = len(dev_plan_checks)
-        
-        print(f"   📊 Architecture Components: {passed}/{total} implemented")
-        
-        for check, status in dev_plan_checks.items():
-            print(f"      {'✅' if status else '❌'} {check}")
-        
-        results['dev_plan_score'] = (passed / total) * 100
+        results['dev_plan_score'] = _score("Architecture Components", dev_plan_checks)
         
     except Exception as e:
         print(f"   ❌ Dev plan verification failed: {str(e)}")
@@ -166,35 +184,28 @@ def verify_vibe_coding_implementation():
     results = {}
     
     try:
-        # Test UI and user experience
-        import streamlit as st
-        import plotly.graph_objects as go
-        
-        # Test project structure
-        import os
-        
-        vibe_checks = {
-            'streamlit_ui': True,  # Visual interface
-            'professional_design': os.path.exists('app.py'),  # Main dashboard
-            'core_modules': os.path.exists('core/'),  # Core directory
-            'utils_modules': os.path.exists('utils/'),  # Utils directory
-            'beginner_friendly': os.path.exists('README.md'),  # Documentation
-            'paper_trading_focus': True,  # Safe testing mode
-            'rapid_development': True,  # Quick setup
-            'immediate_feedback': True,  # Visual results
-            'modern_styling': True,  # Professional appearance
-            'error_handling': True,  # Graceful failures
-        }
-        
-        passed = sum(vibe_checks.values())
-        total = len(vibe_checks)
-        
-        print(f"   📊 Vibe Coding Principles: {passed}/{total} implemented")
-        
-        for check, status in vibe_checks.items():
-            print(f"      {'✅' if status else '❌'} {check}")
-        
-        results['vibe_score'] = (passed / total) * 100
+        # Test UI and user experience (installation check only)
+        streamlit_available = find_spec('streamlit') is not None
+        plotly_available = find_spec('plotly') is not None
+        
+        # Test project structure from a single directory listing
+        with os.scandir('.') as entries:
+            project_entries = {entry.name for entry in entries}
+        
+        vibe_checks = [
+            ('streamlit_ui', streamlit_available),  # Visual interface
+            ('professional_design', 'app.py' in project_entries),  # Main dashboard
+            ('core_modules', 'core' in project_entries),  # Core directory
+            ('utils_modules', 'utils' in project_entries),  # Utils directory
+            ('beginner_friendly', 'README.md' in project_entries),  # Documentation
+            ('paper_trading_focus', True),  # Safe testing mode
+            ('rapid_development', True),  # Quick setup
+            ('immediate_feedback', plotly_available),  # Visual results
+            ('modern_styling', True),  # Professional appearance
+            ('error_handling', True),  # Graceful failures
+        ]
+        
+        results['vibe_score'] = _score("Vibe Coding Principles", vibe_checks)
         
     except Exception as e:
         print(f"   ❌ Vibe coding verification failed: {str(e)}")
@@ -209,34 +220,23 @@ def verify_broker_safety():
     results = {}
     
     try:
-        from core.risk_manager import RiskManager
-        from core.live_trading_engine import LiveTradingEngine
-        
         risk_manager = RiskManager()
         engine = LiveTradingEngine(paper_trading=True)
         
-        safety_checks = {
-            'paper_trading_mode': engine.paper_trading,  # Safe testing
-            'position_limits': engine.max_positions <= 5,  # Reasonable limits
-            'daily_trade_limits': engine.max_daily_trades <= 10,  # Not HFT
-            'risk_management': hasattr(risk_manager, 'validate_trade_risk'),  # Risk controls
-            'stop_loss_required': True,  # Always use stop losses
-            'reasonable_intervals': engine.analysis_interval >= 60,  # Not too frequent
-            'demo_account_focus': True,  # Encourages demo first
-            'error_handling': True,  # Graceful failures
-            'no_spam_trading': True,  # Reasonable request frequency
-            'user_controls': True,  # Manual start/stop
-        }
-        
-        passed = sum(safety_checks.values())
-        total = len(safety_checks)
-        
-        print(f"   📊 Safety Measures: {passed}/{total} implemented")
-        
-        for check, status in safety_checks.items():
-            print(f"      {'✅' if status else '❌'} {check}")
-        
-        results['safety_score'] = (passed / total) * 100
+        safety_checks = [
+            ('paper_trading_mode', engine.paper_trading),  # Safe testing
+            ('position_limits', engine.max_positions <= 5),  # Reasonable limits
+            ('daily_trade_limits', engine.max_daily_trades <= 10),  # Not HFT
+            ('risk_management', hasattr(risk_manager, 'validate_trade_risk')),  # Risk controls
+            ('stop_loss_required', True),  # Always use stop losses
+            ('reasonable_intervals', engine.analysis_interval >= 60),  # Not too frequent
+            ('demo_account_focus', True),  # Encourages demo first
+            ('error_handling', True),  # Graceful failures
+            ('no_spam_trading', True),  # Reasonable request frequency
+            ('user_controls', True),  # Manual start/stop
+        ]
+        
+        results['safety_score'] = _score("Safety Measures", safety_checks)
         
     except Exception as e:
         print(f"   ❌ Safety verification failed: {str(e)}")
@@ -253,49 +253,35 @@ def verify_cross_platform_compatibility():
     try:
         current_platform = platform.system()
         
-        # Test platform-specific features
+        # Test platform-specific features (find_spec avoids loading the MT5 DLL)
         if current_platform == 'Windows':
-            try:
-                import MetaTrader5 as mt5
-                mt5_native = True
-            except ImportError:
-                mt5_native = False
+            mt5_native = find_spec('MetaTrader5') is not None
         else:
             mt5_native = False  # Expected on non-Windows
         
         # Test fallback systems
-        try:
-            import yfinance as yf
-            yahoo_fallback = True
-        except ImportError:
-            yahoo_fallback = False
-        
-        platform_checks = {
-            'windows_support': current_platform == 'Windows' or True,  # Always true
-            'macos_support': current_platform == 'Darwin' or True,  # Always true
-            'mt5_native_windows': mt5_native if current_platform == 'Windows' else True,
-            'yahoo_finance_fallback': yahoo_fallback,  # Real data fallback
-            'python_compatibility': True,  # Cross-platform Python
-            'streamlit_compatibility': True,  # Cross-platform UI
-            'gemini_api_compatibility': True,  # Cross-platform AI
-            'data_processing_compatibility': True,  # pandas/numpy
-        }
+        yahoo_fallback = find_spec('yfinance') is not None
+        
+        platform_checks = [
+            ('windows_support', current_platform == 'Windows' or True),  # Always true
+            ('macos_support', current_platform == 'Darwin' or True),  # Always true
+            ('mt5_native_windows', mt5_native if current_platform == 'Windows' else True),
+            ('yahoo_finance_fallback', yahoo_fallback),  # Real data fallback
+            ('python_compatibility', True),  # Cross-platform Python
+            ('streamlit_compatibility', True),  # Cross-platform UI
+            ('gemini_api_compatibility', True),  # Cross-platform AI
+            ('data_processing_compatibility', True),  # pandas/numpy
+        ]
         
-        passed = sum(platform_checks.values())
-        total = len(platform_checks)
-        
-        print(f"   📊 Platform Compatibility: {passed}/{total} features")
         print(f"   🖥️  Current Platform: {current_platform}")
-        
-        for check, status in platform_checks.items():
-            print(f"      {'✅' if status else '❌'} {check}")
+        platform_score = _score("Platform Compatibility", platform_checks, unit="features")
         
         if current_platform == 'Darwin':
             print("   💡 macOS Note: Using Yahoo Finance for real gold data (MT5 alternative)")
         elif current_platform == 'Windows':
             print("   💡 Windows Note: Full MT5 support available")
         
-        results['platform_score'] = (passed / total) * 100
+        results['platform_score'] = platform_score
         
     except Exception as e:
         print(f"   ❌ Platform verification failed: {str(e)}")
@@ -303,30 +289,13 @@ def verify_cross_platform_compatibility():
     
     return results
 
+# Stage score keys averaged into the overall implementation score
+_SCORE_KEYS = ('strategy_score', 'dev_plan_score', 'vibe_score', 'safety_score', 'platform_score')
+
 def generate_final_report(all_results):
     """Generate comprehensive final report"""
-    print("\n" + "="*70)
-    print("📋 GOLD DIGGER AI BOT - COMPLETE IMPLEMENTATION REPORT")
-    print("="*70)
-    
     # Calculate overall score
-    scores = [
-        all_results.get('strategy_score', 0),
-        all_results.get('dev_plan_score', 0),
-        all_results.get('vibe_score', 0),
-        all_results.get('safety_score', 0),
-        all_results.get('platform_score', 0)
-    ]
-    
-    overall_score = sum(scores) / len(scores)
-    
-    print(f"\n📊 IMPLEMENTATION SCORES:")
-    print(f"   Strategy.md Requirements:     {all_results.get('strategy_score', 0):.1f}%")
-    print(f"   Dev Plan.md Architecture:     {all_results.get('dev_plan_score', 0):.1f}%")
-    print(f"   Vibe Coding Principles:       {all_results.get('vibe_score', 0):.1f}%")
-    print(f"   Broker Safety & Compliance:   {all_results.get('safety_score', 0):.1f}%")
-    print(f"   Cross-Platform Compatibility: {all_results.get('platform_score', 0):.1f}%")
-    print(f"\n🎯 OVERALL IMPLEMENTATION:      {overall_score:.1f}%")
+    overall_score = float(np.mean([all_results.get(key, 0) for key in _SCORE_KEYS]))
     
     # Determine status
     if overall_score >= 95:
@@ -345,67 +314,101 @@ def generate_final_report(all_results):
         status = "❌ NEEDS WORK - Major Issues"
         ready = False
     
-    print(f"\n🚦 IMPLEMENTATION STATUS: {status}")
+    # The report is assembled first and written with a single print
+    report = [
+        "\n" + "="*70,
+        "📋 GOLD DIGGER AI BOT - COMPLETE IMPLEMENTATION REPORT",
+        "="*70,
+        "\n📊 IMPLEMENTATION SCORES:",
+        f"   Strategy.md Requirements:     {all_results.get('strategy_score', 0):.1f}%",
+        f"   Dev Plan.md Architecture:     {all_results.get('dev_plan_score', 0):.1f}%",
+        f"   Vibe Coding Principles:       {all_results.get('vibe_score', 0):.1f}%",
+        f"   Broker Safety & Compliance:   {all_results.get('safety_score', 0):.1f}%",
+        f"   Cross-Platform Compatibility: {all_results.get('platform_score', 0):.1f}%",
+        f"\n🎯 OVERALL IMPLEMENTATION:      {overall_score:.1f}%",
+        f"\n🚦 IMPLEMENTATION STATUS: {status}",
+    ]
     
     # Platform-specific notes
     current_platform = platform.system()
-    print(f"\n💻 PLATFORM-SPECIFIC STATUS:")
+    report.append("\n💻 PLATFORM-SPECIFIC STATUS:")
     
     if current_platform == 'Windows':
-        print("   ✅ Full MT5 native support available")
-        print("   ✅ All features fully functional")
-        print("   ✅ Ready for live trading when desired")
+        report += [
+            "   ✅ Full MT5 native support available",
+            "   ✅ All features fully functional",
+            "   ✅ Ready for live trading when desired",
+        ]
     elif current_platform == 'Darwin':
-        print("   ✅ Real market data via Yahoo Finance")
-        print("   ✅ All features functional with data fallback")
-        print("   ✅ Ready for paper trading immediately")
-        print("   💡 For live trading: Consider Windows environment")
+        report += [
+            "   ✅ Real market data via Yahoo Finance",
+            "   ✅ All features functional with data fallback",
+            "   ✅ Ready for paper trading immediately",
+            "   💡 For live trading: Consider Windows environment",
+        ]
     
     # Safety confirmation
-    print(f"\n🛡️ BROKER SAFETY CONFIRMATION:")
-    print("   ✅ Paper trading mode implemented")
-    print("   ✅ Reasonable trading frequency (60s intervals)")
-    print("   ✅ Position and daily trade limits")
-    print("   ✅ Comprehensive risk management")
-    print("   ✅ Demo account focus encouraged")
-    print("   ✅ No high-frequency trading patterns")
+    report += [
+        "\n🛡️ BROKER SAFETY CONFIRMATION:",
+        "   ✅ Paper trading mode implemented",
+        "   ✅ Reasonable trading frequency (60s intervals)",
+        "   ✅ Position and daily trade limits",
+        "   ✅ Comprehensive risk management",
+        "   ✅ Demo account focus encouraged",
+        "   ✅ No high-frequency trading patterns",
+    ]
     
     # Final recommendations
-    print(f"\n🚀 RECOMMENDATIONS:")
+    report.append("\n🚀 RECOMMENDATIONS:")
     
     if ready:
-        print("   ✅ System is ready for immediate use!")
-        print("   ✅ Start with paper trading mode")
-        print("   ✅ Monitor performance for 1-2 weeks")
-        print("   ✅ All specifications fully implemented")
-        print("   ✅ Safe for broker use")
-        print("   🎯 Dashboard: http://localhost:8501")
+        report += [
+            "   ✅ System is ready for immediate use!",
+            "   ✅ Start with paper trading mode",
+            "   ✅ Monitor performance for 1-2 weeks",
+            "   ✅ All specifications fully implemented",
+            "   ✅ Safe for broker use",
+            "   🎯 Dashboard: http://localhost:8501",
+        ]
     else:
-        print("   🔧 Address any failed checks above")
-        print("   🔧 Re-run verification after fixes")
-        print("   🔧 Test thoroughly before live use")
+        report += [
+            "   🔧 Address any failed checks above",
+            "   🔧 Re-run verification after fixes",
+            "   🔧 Test thoroughly before live use",
+        ]
     
-    print("\n" + "="*70)
+    report.append("\n" + "="*70)
+    print("\n".join(report))
     
     return ready
 
 def main():
     """Main verification function"""
+    # Batch console output; it is flushed once at the end of the run
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    
     print_banner()
     
     # Run all verifications
     all_results = {}
     
-    # Verify against all specification files
-    all_results.update(verify_strategy_md_implementation())
-    all_results.update(verify_dev_plan_implementation())
-    all_results.update(verify_vibe_coding_implementation())
-    all_results.update(verify_broker_safety())
-    all_results.update(verify_cross_platform_compatibility())
+    # Verify against all specification files; the stages are independent and
+    # mostly wait on network/terminal I/O, so they run concurrently
+    for stage_results in run_stages([
+        verify_strategy_md_implementation,
+        verify_dev_plan_implementation,
+        verify_vibe_coding_implementation,
+        verify_broker_safety,
+        verify_cross_platform_compatibility,
+    ]):
+        all_results.update(stage_results)
     
     # Generate final report
     ready = generate_final_report(all_results)
     
+    sys.stdout.flush()
+    
     # Exit with appropriate code
     if ready:
         print("\n🎉 CONGRATULATIONS! Complete implementation verified!")
@@ -5,12 +5,78 @@ Verify that all mock data has been replaced with real market data
 """
 
 import sys
-from datetime import datetime
+import threading
+import time
+import functools
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
 import yfinance as yf
 
-def print_banner():
-    """Print verification banner"""
-    banner = """
+from core.mt5_connector import MT5Connector
+from utils.data_manager import DataManager
+from backtest.backtester import BacktestEngine
+from utils.verification import run_stages
+
+# Shared gold futures ticker; its 5-day history is fetched once per script run
+_TICKER = yf.Ticker('GC=F')
+_HIST_PERIOD = '5d'
+_HIST_INTERVAL = '5m'
+# yfinance keeps per-Ticker history state, so concurrent stages take turns
+_HIST_LOCK = threading.Lock()
+
+# On-disk history cache, only consulted while the market is closed
+_CACHE_DIR = Path('~/.cache/gold_digger').expanduser()
+_CACHE_MAX_AGE = 30 * 60  # seconds
+
+def _market_closed() -> bool:
+    """Gold futures are closed on Saturday and Sunday (UTC)"""
+    return datetime.now(timezone.utc).weekday() >= 5
+
+def _gold_hist():
+    """
+    Fetch 5 days of 5-minute GC=F history once, reusing a recent weekend copy from disk
+    
+    Every check reads this one frame (see _last_session for the 1-day view),
+    so the script makes a single Yahoo Finance round trip. Stages calling in
+    concurrently wait for the first fetch and then share its result.
+    """
+    with _HIST_LOCK:
+        return _fetch_gold_hist()
+
+@functools.lru_cache(maxsize=1)
+def _fetch_gold_hist():
+    """_gold_hist body; callers hold _HIST_LOCK"""
+    period, interval = _HIST_PERIOD, _HIST_INTERVAL
+    closed = _market_closed()
+    cache_file = _CACHE_DIR / f"GC_F_{period}_{interval}_{datetime.now(timezone.utc).date()}.pkl"
+    
+    if closed and cache_file.exists() and time.time() - cache_file.stat().st_mtime < _CACHE_MAX_AGE:
+        return pd.read_pickle(cache_file)
+    
+    # Skip the post-processing passes the verification never reads
+    # (price adjustment, dividend/split columns, extended hours, repair)
+    data = _TICKER.history(
+        period=period, interval=interval,
+        auto_adjust=False, actions=False, prepost=False, repair=False, keepna=False
+    )
+    
+    if closed and not data.empty:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        data.to_pickle(cache_file)
+    
+    return data
+
+def _last_session(data):
+    """The candles of the most recent trading day, as period='1d' would return"""
+    if data.empty:
+        return data
+    days = data.index.normalize()
+    return data[days == days[-1]]
+
+# Banner text, rendered once at import
+_BANNER = """
     ╔══════════════════════════════════════════════════════════════╗
     ║                                                              ║
     ║     ✅ GOLD DIGGER AI BOT - REAL DATA FIXES VERIFIED ✅     ║
@@ -18,8 +84,11 @@ def print_banner():
     ║           All Mock Data Replaced with Real Market Data      ║
     ║                                                              ║
     ╚══════════════════════════════════════════════════════════════╝
-    """
-    print(banner)
+    """ + "\n"
+
+def print_banner():
+    """Print verification banner"""
+    sys.stdout.write(_BANNER)
 
 def verify_real_market_data():
     """Verify real market data is working"""
@@ -27,12 +96,11 @@ def verify_real_market_data():
     
     try:
         # Test Yahoo Finance gold data
-        ticker = yf.Ticker('GC=F')
-        data = ticker.history(period='1d', interval='5m')
+        data = _last_session(_gold_hist())
         
         if not data.empty:
-            current_price = data['Close'].iloc[-1]
-            volume = data['Volume'].iloc[-1]
+            current_price = data['Close'].to_numpy()[-1]
+            volume = data['Volume'].to_numpy()[-1]
             timestamp = data.index[-1]
             
             print(f"   ✅ Real Gold Price: ${current_price:.2f}")
@@ -41,8 +109,11 @@ def verify_real_market_data():
             print(f"   📈 Data Points: {len(data)} candles")
             
             # Verify data is recent (within reasonable time for weekend)
-            time_diff = datetime.now() - timestamp.replace(tzinfo=None)
-            hours_old = time_diff.total_seconds() / 3600
+            # Ages are computed in UTC over the whole index; yfinance returns an
+            # exchange-local tz-aware index, so stripping tzinfo skewed by the offset
+            index_utc = data.index.tz_convert('UTC') if data.index.tz is not None else data.index.tz_localize('UTC')
+            ages_hours = (pd.Timestamp.now(tz='UTC') - index_utc).total_seconds() / 3600
+            hours_old = float(ages_hours.to_numpy()[-1])
             
             if hours_old < 72:  # Within 3 days (accounting for weekends)
                 print(f"   ✅ Data Freshness: {hours_old:.1f} hours old (GOOD)")
@@ -63,8 +134,6 @@ def verify_mt5_connector():
     print("\n🔗 Verifying MT5 Connector Real Data Integration...")
     
     try:
-        from core.mt5_connector import MT5Connector
-        
         connector = MT5Connector()
         result = connector.test_connection()
         
@@ -98,8 +167,6 @@ def verify_data_manager():
     print("\n📊 Verifying Data Manager...")
     
     try:
-        from utils.data_manager import DataManager
-        
         dm = DataManager()
         
         # Test recent trades (should be empty initially)
@@ -128,28 +195,16 @@ def verify_backtesting_ready():
     print("\n🔬 Verifying Backtesting with Real Data...")
     
     try:
-        from backtest.backtester import BacktestEngine
-        
         # Test backtester initialization
         backtester = BacktestEngine(100000)
         print("   ✅ Backtester: Initialized")
         
         # Test with small real data sample
-        ticker = yf.Ticker('GC=F')
-        data = ticker.history(period='5d', interval='5m')
+        data = _gold_hist()
         
         if not data.empty:
-            # Convert to expected format
-            import pandas as pd
-            
-            backtest_data = pd.DataFrame({
-                'Open': data['Open'],
-                'High': data['High'],
-                'Low': data['Low'],
-                'Close': data['Close'],
-                'Volume': data['Volume']
-            })
-            backtest_data.index = data.index
+            # Select the OHLCV columns the backtester expects (keeps the index)
+            backtest_data = data[['Open', 'High', 'Low', 'Close', 'Volume']]
             
             print(f"   📊 Real Data Sample: {len(backtest_data)} candles")
             print(f"   📅 Date Range: {backtest_data.index[0].date()} to {backtest_data.index[-1].date()}")
@@ -223,10 +278,9 @@ def generate_final_report(results):
     
     print(f"\n💰 CURRENT REAL GOLD PRICE:")
     try:
-        ticker = yf.Ticker('GC=F')
-        data = ticker.history(period='1d', interval='1m')
+        data = _gold_hist()
         if not data.empty:
-            current_price = data['Close'].iloc[-1]
+            current_price = data['Close'].to_numpy()[-1]
             print(f"   🏆 ${current_price:.2f} (Live from Yahoo Finance)")
             print("   📊 Compare with TradingView: https://www.tradingview.com/symbols/XAUUSD/")
         else:
@@ -254,20 +308,28 @@ def generate_final_report(results):
 
 def main():
     """Main verification function"""
+    # Batch console output; it is flushed once at the end of the run
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    
     print_banner()
     
-    # Run all verifications
-    results = {
-        'real_data': verify_real_market_data(),
-        'mt5_connector': verify_mt5_connector(),
-        'data_manager': verify_data_manager(),
-        'backtesting': verify_backtesting_ready(),
-        'dashboard': verify_dashboard_fixes()
+    # Run all verifications concurrently; they are independent and mostly
+    # wait on Yahoo Finance, the MT5 bridge and the database
+    stages = {
+        'real_data': verify_real_market_data,
+        'mt5_connector': verify_mt5_connector,
+        'data_manager': verify_data_manager,
+        'backtesting': verify_backtesting_ready,
+        'dashboard': verify_dashboard_fixes
     }
+    results = dict(zip(stages, run_stages(list(stages.values()))))
     
     # Generate final report
     ready = generate_final_report(results)
     
+    sys.stdout.flush()
+    
     # Exit with appropriate code
     if ready:
         print("\n🎉 SUCCESS! All real data fixes verified and working!")
@@ -5,11 +5,51 @@ This runs on Windows VM/machine to provide MT5 access to macOS
 Based on David _Detnator_'s solution from MQL5 forum
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, g, jsonify, request
 import MetaTrader5 as mt5
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+import hashlib
+import json
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from types import MappingProxyType
+
+try:
+    from waitress import serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import zmq
+    ZMQ_AVAILABLE = True
+except ImportError:
+    ZMQ_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    from websockets.exceptions import ConnectionClosed
+    from websockets.sync.server import serve as serve_websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -17,13 +57,297 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
-# Global MT5 connection status
+# Global MT5 connection status (written under init_lock)
 mt5_initialized = False
+init_lock = threading.Lock()
+
+class TerminalGate:
+    """
+    Shared/exclusive gate around the MT5 terminal handle
+    
+    Requests and stream passes hold it shared while they call into MT5; the
+    health check holds it exclusively while it shuts down and reinitializes
+    the terminal. A waiting reconnect blocks new shared holders so it cannot
+    be starved by a steady stream of requests.
+    """
+    
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._exclusive = False
+        self._exclusive_waiting = 0
+    
+    def acquire_shared(self):
+        with self._cond:
+            while self._exclusive or self._exclusive_waiting:
+                self._cond.wait()
+            self._readers += 1
+    
+    def release_shared(self):
+        with self._cond:
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+    
+    @contextmanager
+    def shared(self):
+        self.acquire_shared()
+        try:
+            yield
+        finally:
+            self.release_shared()
+    
+    @contextmanager
+    def exclusive(self):
+        with self._cond:
+            self._exclusive_waiting += 1
+            while self._exclusive or self._readers:
+                self._cond.wait()
+            self._exclusive_waiting -= 1
+            self._exclusive = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._exclusive = False
+                self._cond.notify_all()
+
+terminal_gate = TerminalGate()
+
+@app.before_request
+def _enter_terminal_gate():
+    terminal_gate.acquire_shared()
+    g.terminal_gate_held = True
+
+@app.teardown_request
+def _leave_terminal_gate(exc=None):
+    if g.pop('terminal_gate_held', False):
+        terminal_gate.release_shared()
+
+# Background health check: ping the terminal and reinitialize with backoff
+HEALTH_CHECK_INTERVAL = 30
+HEALTH_CHECK_MAX_BACKOFF = 300
+
+# Upper bound on symbol/timeframe pairs per /mt5/rates/batch call
+MAX_BATCH_REQUESTS = 50
+
+# Timeframe strings accepted by the rates endpoints (read-only, shared by all threads)
+TIMEFRAME_MAP = MappingProxyType({
+    'M1': mt5.TIMEFRAME_M1,
+    'M5': mt5.TIMEFRAME_M5,
+    'M15': mt5.TIMEFRAME_M15,
+    'M30': mt5.TIMEFRAME_M30,
+    'H1': mt5.TIMEFRAME_H1,
+    'H4': mt5.TIMEFRAME_H4,
+    'D1': mt5.TIMEFRAME_D1
+})
+
+# Order request fields that are the same for every market deal
+# (type_filling depends on the symbol, see get_filling_mode)
+ORDER_REQUEST_DEFAULTS = MappingProxyType({
+    "action": mt5.TRADE_ACTION_DEAL,
+    "deviation": 20,
+    "magic": 234000,
+    "type_time": mt5.ORDER_TIME_GTC,
+})
+
+# symbol_info().filling_mode flags
+SYMBOL_FILLING_FOK = 1
+SYMBOL_FILLING_IOC = 2
+
+# Order submission: one order_send at a time on the shared terminal handle,
+# retried once at a fresh price on a requote / off-quotes rejection
+order_lock = threading.Lock()
+ORDER_SEND_ATTEMPTS = 2
+ORDER_RETRY_RETCODES = (mt5.TRADE_RETCODE_REQUOTE, mt5.TRADE_RETCODE_PRICE_OFF)
+ORDER_SUCCESS_RETCODES = (mt5.TRADE_RETCODE_DONE, mt5.TRADE_RETCODE_DONE_PARTIAL)
+
+# ZeroMQ tick stream: frames are [symbol, msgpack (or JSON) tick payload]
+TICK_PUB_PORT = int(os.getenv('MT5_TICK_PUB_PORT', '5556'))
+TICK_PUB_SYMBOLS = tuple(filter(None, os.getenv('MT5_TICK_SYMBOLS', 'XAUUSD').split(',')))
+TICK_PUB_INTERVAL = 0.1
+
+# WebSocket push streams (/ws/ticks, /ws/positions) on their own port, so
+# they work under any WSGI server
+WS_PORT = int(os.getenv('MT5_WS_PORT', '8765'))
+WS_POLL_INTERVAL = 0.1
+WS_POSITIONS_INTERVAL = 0.5
+WS_SUBSCRIBE_TIMEOUT = 2.0
+
+# /mt5/positions/delta: recent position snapshots keyed by etag, and the
+# fields that can change on an open position
+POSITION_SNAPSHOT_LIMIT = 32
+POSITION_DELTA_FIELDS = ("price_current", "profit", "swap", "sl", "tp", "volume")
+_position_snapshots = OrderedDict()
+_position_snapshots_lock = threading.Lock()
+
+# Short-lived caches for read-only MT5 lookups (entries are (fetched_at, value))
+TICK_CACHE_TTL = 0.2
+ACCOUNT_CACHE_TTL = 1.0
+_tick_cache = {}
+_account_cache = (0.0, None)
+
+def cached_tick(symbol):
+    """symbol_info_tick(), reused for TICK_CACHE_TTL seconds per symbol"""
+    now = time.monotonic()
+    fetched_at, tick = _tick_cache.get(symbol, (0.0, None))
+    if tick is None or now - fetched_at >= TICK_CACHE_TTL:
+        tick = mt5.symbol_info_tick(symbol)
+        if tick is not None:
+            _tick_cache[symbol] = (now, tick)
+    return tick
+
+def cached_account_info():
+    """account_info(), reused for ACCOUNT_CACHE_TTL seconds"""
+    global _account_cache
+    now = time.monotonic()
+    fetched_at, account_info = _account_cache
+    if account_info is None or now - fetched_at >= ACCOUNT_CACHE_TTL:
+        account_info = mt5.account_info()
+        if account_info is not None:
+            _account_cache = (now, account_info)
+    return account_info
+
+def _health_loop():
+    """Reinitialize MT5 out-of-band when the terminal drops its connection"""
+    global mt5_initialized
+    delay = HEALTH_CHECK_INTERVAL
+    
+    while True:
+        time.sleep(delay)
+        try:
+            terminal_info = mt5.terminal_info()
+            if terminal_info is not None and terminal_info.connected:
+                delay = HEALTH_CHECK_INTERVAL
+                continue
+            
+            logger.warning("MT5 terminal disconnected, reinitializing")
+            # Wait out in-flight requests, stream passes and order sends
+            # (order_lock) so nothing is mid-call when the handle is torn down
+            with terminal_gate.exclusive(), order_lock, init_lock:
+                mt5.shutdown()
+                mt5_initialized = bool(mt5.initialize())
+                get_filling_mode.cache_clear()
+                # initialize() succeeds with the broker link still down, so
+                # back off on the terminal's connected flag instead
+                terminal_info = mt5.terminal_info() if mt5_initialized else None
+                connected = terminal_info is not None and terminal_info.connected
+            
+            if connected:
+                logger.info("MT5 reinitialized")
+                delay = HEALTH_CHECK_INTERVAL
+            else:
+                delay = min(delay * 2, HEALTH_CHECK_MAX_BACKOFF)
+                logger.error(f"MT5 reinitialization failed: {mt5.last_error()} (retrying in {delay}s)")
+        except Exception as e:
+            logger.error(f"MT5 health check error: {str(e)}")
+
+def start_health_monitor():
+    """Start the MT5 health check daemon thread"""
+    threading.Thread(target=_health_loop, name="mt5-health", daemon=True).start()
+
+@lru_cache(maxsize=64)
+def get_filling_mode(symbol):
+    """
+    Order filling mode the broker accepts for symbol, detected once per symbol
+    
+    IOC is kept when allowed (the previous fixed choice), then FOK, then RETURN.
+    Raises ValueError for an unknown symbol (not cached, so it is retried).
+    """
+    info = mt5.symbol_info(symbol)
+    if info is None:
+        raise ValueError(f"Symbol {symbol} not found: {mt5.last_error()}")
+    
+    if info.filling_mode & SYMBOL_FILLING_IOC:
+        return mt5.ORDER_FILLING_IOC
+    if info.filling_mode & SYMBOL_FILLING_FOK:
+        return mt5.ORDER_FILLING_FOK
+    return mt5.ORDER_FILLING_RETURN
+
+def ojsonify(obj, status=200):
+    """jsonify() replacement that encodes with orjson (numpy-aware) when available"""
+    if ORJSON_AVAILABLE:
+        return Response(
+            orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY),
+            status=status,
+            mimetype='application/json'
+        )
+    
+    response = jsonify(obj)
+    response.status_code = status
+    return response
+
+def send_order(request_dict):
+    """
+    Send a market deal under order_lock, re-pricing and retrying on requotes
+    
+    Returns the last order_send result (None if MT5 returned nothing)
+    """
+    with order_lock:
+        for attempt in range(ORDER_SEND_ATTEMPTS):
+            result = mt5.order_send(request_dict)
+            if result is None or result.retcode not in ORDER_RETRY_RETCODES:
+                break
+            if attempt + 1 < ORDER_SEND_ATTEMPTS:
+                tick = mt5.symbol_info_tick(request_dict["symbol"])
+                if tick is None:
+                    break
+                request_dict["price"] = tick.ask if request_dict["type"] == mt5.ORDER_TYPE_BUY else tick.bid
+                logger.info(f"Order requoted ({result.retcode}), retrying at {request_dict['price']}")
+    
+    return result
+
+def _pack_tick(payload):
+    """Serialize a tick payload for the PUB socket"""
+    if MSGPACK_AVAILABLE:
+        return msgpack.packb(payload)
+    return json.dumps(payload).encode()
+
+def _tick_publisher_loop(socket):
+    """Publish each new tick for TICK_PUB_SYMBOLS, polling MT5 every TICK_PUB_INTERVAL"""
+    last_tick_msc = {}
+    
+    while True:
+        time.sleep(TICK_PUB_INTERVAL)
+        if not mt5_initialized:
+            continue
+        
+        try:
+            with terminal_gate.shared():
+                for symbol in TICK_PUB_SYMBOLS:
+                    tick = mt5.symbol_info_tick(symbol)
+                    if tick is None or last_tick_msc.get(symbol) == tick.time_msc:
+                        continue
+                    
+                    last_tick_msc[symbol] = tick.time_msc
+                    _tick_cache[symbol] = (time.monotonic(), tick)
+                    
+                    socket.send_multipart([symbol.encode(), _pack_tick({
+                        "symbol": symbol,
+                        "time": tick.time,
+                        "time_msc": tick.time_msc,
+                        "bid": tick.bid,
+                        "ask": tick.ask,
+                        "last": tick.last,
+                        "volume": tick.volume
+                    })])
+        except Exception as e:
+            logger.error(f"Tick publisher error: {str(e)}")
+
+def start_tick_publisher():
+    """Start streaming ticks on a ZeroMQ PUB socket (requires pyzmq)"""
+    if not ZMQ_AVAILABLE:
+        return False
+    
+    socket = zmq.Context.instance().socket(zmq.PUB)
+    socket.bind(f"tcp://*:{TICK_PUB_PORT}")
+    threading.Thread(target=_tick_publisher_loop, args=(socket,), name="mt5-ticks", daemon=True).start()
+    return True
 
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
+    return ojsonify({
         "status": "healthy",
         "service": "MT5 REST API Bridge",
         "mt5_initialized": mt5_initialized,
@@ -36,19 +360,21 @@ def initialize_mt5():
     global mt5_initialized
     
     try:
-        if not mt5.initialize():
-            return jsonify({
-                "success": False,
-                "message": f"MT5 initialization failed: {mt5.last_error()}"
-            })
-        
-        mt5_initialized = True
+        with init_lock:
+            if not mt5.initialize():
+                return ojsonify({
+                    "success": False,
+                    "message": f"MT5 initialization failed: {mt5.last_error()}"
+                })
+            
+            mt5_initialized = True
+            get_filling_mode.cache_clear()
         
         # Get terminal info
         terminal_info = mt5.terminal_info()
         account_info = mt5.account_info()
         
-        return jsonify({
+        return ojsonify({
             "success": True,
             "message": "MT5 initialized successfully",
             "terminal_info": {
@@ -64,7 +390,7 @@ def initialize_mt5():
         })
         
     except Exception as e:
-        return jsonify({
+        return ojsonify({
             "success": False,
             "message": f"Error initializing MT5: {str(e)}"
         })
@@ -73,14 +399,14 @@ def initialize_mt5():
 def get_account_info():
     """Get MT5 account information"""
     if not mt5_initialized:
-        return jsonify({"success": False, "message": "MT5 not initialized"})
+        return ojsonify({"success": False, "message": "MT5 not initialized"})
     
     try:
-        account_info = mt5.account_info()
+        account_info = cached_account_info()
         if account_info is None:
-            return jsonify({"success": False, "message": "Failed to get account info"})
+            return ojsonify({"success": False, "message": "Failed to get account info"})
         
-        return jsonify({
+        return ojsonify({
             "success": True,
             "account": {
                 "login": account_info.login,
@@ -104,71 +430,128 @@ def get_account_info():
         })
         
     except Exception as e:
-        return jsonify({"success": False, "message": f"Error: {str(e)}"})
+        return ojsonify({"success": False, "message": f"Error: {str(e)}"})
+
+def get_timeframe(timeframe_str):
+    """Convert a timeframe string (M1 ... D1) to its MT5 constant, defaulting to M5"""
+    return TIMEFRAME_MAP.get(timeframe_str, mt5.TIMEFRAME_M5)
+
+def rates_to_rows(rates):
+    """Convert an MT5 rates array to a list of dictionaries"""
+    # tolist() yields native Python values in C, no per-field casting needed
+    fields = rates.dtype.names
+    return [dict(zip(fields, rate)) for rate in rates.tolist()]
 
 @app.route('/mt5/rates', methods=['GET'])
 def get_rates():
     """Get market rates data"""
     if not mt5_initialized:
-        return jsonify({"success": False, "message": "MT5 not initialized"})
+        return ojsonify({"success": False, "message": "MT5 not initialized"})
     
     try:
         symbol = request.args.get('symbol', 'XAUUSD')
         timeframe_str = request.args.get('timeframe', 'M5')
         count = int(request.args.get('count', 100))
-        
-        # Convert timeframe string to MT5 constant
-        timeframe_map = {
-            'M1': mt5.TIMEFRAME_M1,
-            'M5': mt5.TIMEFRAME_M5,
-            'M15': mt5.TIMEFRAME_M15,
-            'M30': mt5.TIMEFRAME_M30,
-            'H1': mt5.TIMEFRAME_H1,
-            'H4': mt5.TIMEFRAME_H4,
-            'D1': mt5.TIMEFRAME_D1
-        }
-        
-        timeframe = timeframe_map.get(timeframe_str, mt5.TIMEFRAME_M5)
-        
-        # Get rates
-        rates = mt5.copy_rates_from_pos(symbol, timeframe, 0, count)
+        from_time = request.args.get('from_time', type=int)
+        
+        timeframe = get_timeframe(timeframe_str)
+        
+        # Get rates: with from_time (unix seconds, inclusive, so the still-forming
+        # last bar is refreshed) only the bars the client does not have yet
+        if from_time is not None:
+            # The range end is padded because bar times are in broker server time
+            rates = mt5.copy_rates_range(
+                symbol, timeframe,
+                datetime.fromtimestamp(from_time, tz=timezone.utc),
+                datetime.now(timezone.utc) + timedelta(days=1)
+            )
+        else:
+            rates = mt5.copy_rates_from_pos(symbol, timeframe, 0, count)
         
         if rates is None:
-            return jsonify({
+            return ojsonify({
                 "success": False,
                 "message": f"Failed to get rates for {symbol}: {mt5.last_error()}"
             })
         
-        # Convert to list of dictionaries
-        rates_list = []
-        for rate in rates:
-            rates_list.append({
-                "time": int(rate['time']),
-                "open": float(rate['open']),
-                "high": float(rate['high']),
-                "low": float(rate['low']),
-                "close": float(rate['close']),
-                "tick_volume": int(rate['tick_volume']),
-                "spread": int(rate['spread']),
-                "real_volume": int(rate['real_volume'])
-            })
-        
-        return jsonify({
+        # Time of the newest bar returned; pass it back as from_time on the next poll
+        last_time = int(rates[-1]['time']) if len(rates) else from_time
+        
+        # Binary mode: ship the structured array as-is, described by headers
+        if request.args.get('format') == 'binary':
+            return Response(
+                rates.tobytes(),
+                mimetype='application/octet-stream',
+                headers={
+                    "X-Symbol": symbol,
+                    "X-Timeframe": timeframe_str,
+                    "X-Count": str(len(rates)),
+                    "X-Dtype": json.dumps(rates.dtype.descr),
+                    "X-Last-Time": str(last_time or '')
+                }
+            )
+        
+        rates_list = rates_to_rows(rates)
+        
+        response = ojsonify({
             "success": True,
             "symbol": symbol,
             "timeframe": timeframe_str,
             "count": len(rates_list),
+            "last_time": last_time,
             "data": rates_list
         })
+        response.headers["X-Last-Time"] = str(last_time or '')
+        return response
         
     except Exception as e:
-        return jsonify({"success": False, "message": f"Error: {str(e)}"})
+        return ojsonify({"success": False, "message": f"Error: {str(e)}"})
+
+@app.route('/mt5/rates/batch', methods=['POST'])
+def get_rates_batch():
+    """Get market rates for several symbol/timeframe pairs in one request"""
+    if not mt5_initialized:
+        return ojsonify({"success": False, "message": "MT5 not initialized"})
+    
+    try:
+        data = request.get_json() or {}
+        rate_requests = data.get('requests', [])
+        
+        if len(rate_requests) > MAX_BATCH_REQUESTS:
+            return ojsonify({
+                "success": False,
+                "message": f"Too many requests in batch (max {MAX_BATCH_REQUESTS})"
+            })
+        
+        results = {}
+        errors = {}
+        for rate_request in rate_requests:
+            symbol = rate_request.get('symbol', 'XAUUSD')
+            timeframe_str = rate_request.get('timeframe', 'M5')
+            count = int(rate_request.get('count', 100))
+            key = f"{symbol}_{timeframe_str}"
+            
+            rates = mt5.copy_rates_from_pos(symbol, get_timeframe(timeframe_str), 0, count)
+            
+            if rates is None:
+                errors[key] = f"Failed to get rates for {symbol}: {mt5.last_error()}"
+            else:
+                results[key] = rates_to_rows(rates)
+        
+        return ojsonify({
+            "success": not errors,
+            "data": results,
+            "errors": errors
+        })
+        
+    except Exception as e:
+        return ojsonify({"success": False, "message": f"Error: {str(e)}"})
 
 @app.route('/mt5/order', methods=['POST'])
 def place_order():
     """Place trading order"""
     if not mt5_initialized:
-        return jsonify({"success": False, "message": "MT5 not initialized"})
+        return ojsonify({"success": False, "message": "MT5 not initialized"})
     
     try:
         data = request.get_json()
@@ -184,23 +567,20 @@ def place_order():
         if order_type.upper() == 'BUY':
             order_type_mt5 = mt5.ORDER_TYPE_BUY
             if price is None:
-                price = mt5.symbol_info_tick(symbol).ask
+                price = cached_tick(symbol).ask
         else:
             order_type_mt5 = mt5.ORDER_TYPE_SELL
             if price is None:
-                price = mt5.symbol_info_tick(symbol).bid
+                price = cached_tick(symbol).bid
         
         request_dict = {
-            "action": mt5.TRADE_ACTION_DEAL,
+            **ORDER_REQUEST_DEFAULTS,
             "symbol": symbol,
             "volume": volume,
             "type": order_type_mt5,
             "price": price,
-            "deviation": 20,
-            "magic": 234000,
             "comment": "Gold Digger AI Bot",
-            "type_time": mt5.ORDER_TIME_GTC,
-            "type_filling": mt5.ORDER_FILLING_IOC,
+            "type_filling": get_filling_mode(symbol),
         }
         
         if sl:
@@ -209,16 +589,22 @@ def place_order():
             request_dict["tp"] = float(tp)
         
         # Send order
-        result = mt5.order_send(request_dict)
+        result = send_order(request_dict)
+        
+        if result is None:
+            return ojsonify({
+                "success": False,
+                "message": f"Order failed: {mt5.last_error()}"
+            })
         
-        if result.retcode != mt5.TRADE_RETCODE_DONE:
-            return jsonify({
+        if result.retcode not in ORDER_SUCCESS_RETCODES:
+            return ojsonify({
                 "success": False,
                 "message": f"Order failed: {result.comment}",
                 "retcode": result.retcode
             })
         
-        return jsonify({
+        return ojsonify({
             "success": True,
             "message": "Order placed successfully",
             "order": {
@@ -232,95 +618,155 @@ def place_order():
         })
         
     except Exception as e:
-        return jsonify({"success": False, "message": f"Error: {str(e)}"})
+        return ojsonify({"success": False, "message": f"Error: {str(e)}"})
+
+def position_to_dict(pos):
+    """Convert an MT5 position record to a dictionary"""
+    return {
+        "ticket": pos.ticket,
+        "time": pos.time,
+        "type": pos.type,
+        "magic": pos.magic,
+        "identifier": pos.identifier,
+        "reason": pos.reason,
+        "volume": pos.volume,
+        "price_open": pos.price_open,
+        "sl": pos.sl,
+        "tp": pos.tp,
+        "price_current": pos.price_current,
+        "swap": pos.swap,
+        "profit": pos.profit,
+        "symbol": pos.symbol,
+        "comment": pos.comment,
+        "external_id": pos.external_id
+    }
 
 @app.route('/mt5/positions', methods=['GET'])
 def get_positions():
     """Get open positions"""
     if not mt5_initialized:
-        return jsonify({"success": False, "message": "MT5 not initialized"})
+        return ojsonify({"success": False, "message": "MT5 not initialized"})
     
     try:
         positions = mt5.positions_get()
         
         if positions is None:
-            return jsonify({"success": True, "positions": []})
-        
-        positions_list = []
-        for pos in positions:
-            positions_list.append({
-                "ticket": pos.ticket,
-                "time": pos.time,
-                "type": pos.type,
-                "magic": pos.magic,
-                "identifier": pos.identifier,
-                "reason": pos.reason,
-                "volume": pos.volume,
-                "price_open": pos.price_open,
-                "sl": pos.sl,
-                "tp": pos.tp,
-                "price_current": pos.price_current,
-                "swap": pos.swap,
-                "profit": pos.profit,
-                "symbol": pos.symbol,
-                "comment": pos.comment,
-                "external_id": pos.external_id
-            })
+            return ojsonify({"success": True, "positions": []})
         
-        return jsonify({
+        positions_list = [position_to_dict(pos) for pos in positions]
+        
+        return ojsonify({
             "success": True,
             "positions": positions_list
         })
         
     except Exception as e:
-        return jsonify({"success": False, "message": f"Error: {str(e)}"})
+        return ojsonify({"success": False, "message": f"Error: {str(e)}"})
+
+@app.route('/mt5/positions/delta', methods=['GET'])
+def get_positions_delta():
+    """
+    Get open positions as changes since a previous response
+    
+    Pass the etag of the last response as since_etag to receive only added
+    positions, removed tickets and changed fields of the rest. Without a known
+    since_etag the full list is returned (with "full": true).
+    """
+    if not mt5_initialized:
+        return ojsonify({"success": False, "message": "MT5 not initialized"})
+    
+    try:
+        positions = mt5.positions_get() or ()
+        current = {pos.ticket: position_to_dict(pos) for pos in positions}
+        etag = hashlib.blake2b(repr(sorted(current.items())).encode(), digest_size=8).hexdigest()
+        since_etag = request.args.get('since_etag')
+        
+        with _position_snapshots_lock:
+            previous = _position_snapshots.get(since_etag)
+            _position_snapshots[etag] = current
+            _position_snapshots.move_to_end(etag)
+            while len(_position_snapshots) > POSITION_SNAPSHOT_LIMIT:
+                _position_snapshots.popitem(last=False)
+        
+        if previous is None:
+            return ojsonify({
+                "success": True,
+                "full": True,
+                "etag": etag,
+                "positions": list(current.values())
+            })
+        
+        updated = []
+        for ticket in current.keys() & previous.keys():
+            changes = {
+                field: current[ticket][field]
+                for field in POSITION_DELTA_FIELDS
+                if current[ticket][field] != previous[ticket][field]
+            }
+            if changes:
+                updated.append({"ticket": ticket, **changes})
+        
+        return ojsonify({
+            "success": True,
+            "full": False,
+            "etag": etag,
+            "added": [current[ticket] for ticket in current.keys() - previous.keys()],
+            "removed": list(previous.keys() - current.keys()),
+            "updated": updated
+        })
+        
+    except Exception as e:
+        return ojsonify({"success": False, "message": f"Error: {str(e)}"})
 
 @app.route('/mt5/close/<int:ticket>', methods=['POST'])
 def close_position(ticket):
     """Close position by ticket"""
     if not mt5_initialized:
-        return jsonify({"success": False, "message": "MT5 not initialized"})
+        return ojsonify({"success": False, "message": "MT5 not initialized"})
     
     try:
         # Get position info
         positions = mt5.positions_get(ticket=ticket)
         if not positions:
-            return jsonify({"success": False, "message": "Position not found"})
+            return ojsonify({"success": False, "message": "Position not found"})
         
         position = positions[0]
         
         # Prepare close request
         if position.type == mt5.POSITION_TYPE_BUY:
             order_type = mt5.ORDER_TYPE_SELL
-            price = mt5.symbol_info_tick(position.symbol).bid
+            price = cached_tick(position.symbol).bid
         else:
             order_type = mt5.ORDER_TYPE_BUY
-            price = mt5.symbol_info_tick(position.symbol).ask
+            price = cached_tick(position.symbol).ask
         
         close_request = {
-            "action": mt5.TRADE_ACTION_DEAL,
+            **ORDER_REQUEST_DEFAULTS,
             "symbol": position.symbol,
             "volume": position.volume,
             "type": order_type,
             "position": ticket,
             "price": price,
-            "deviation": 20,
-            "magic": 234000,
             "comment": "Gold Digger AI Bot - Close",
-            "type_time": mt5.ORDER_TIME_GTC,
-            "type_filling": mt5.ORDER_FILLING_IOC,
+            "type_filling": get_filling_mode(position.symbol),
         }
         
-        result = mt5.order_send(close_request)
+        result = send_order(close_request)
         
-        if result.retcode != mt5.TRADE_RETCODE_DONE:
-            return jsonify({
+        if result is None:
+            return ojsonify({
+                "success": False,
+                "message": f"Close failed: {mt5.last_error()}"
+            })
+        
+        if result.retcode not in ORDER_SUCCESS_RETCODES:
+            return ojsonify({
                 "success": False,
                 "message": f"Close failed: {result.comment}",
                 "retcode": result.retcode
             })
         
-        return jsonify({
+        return ojsonify({
             "success": True,
             "message": "Position closed successfully",
             "result": {
@@ -331,13 +777,118 @@ def close_position(ticket):
         })
         
     except Exception as e:
-        return jsonify({"success": False, "message": f"Error: {str(e)}"})
+        return ojsonify({"success": False, "message": f"Error: {str(e)}"})
 
 @app.route('/shutdown', methods=['POST'])
 def shutdown():
     """Shutdown the server"""
     mt5.shutdown()
-    return jsonify({"message": "Server shutting down"})
+    return ojsonify({"message": "Server shutting down"})
+
+def _client_wait(websocket, timeout):
+    """
+    Wait up to timeout seconds between polls, watching for the client closing
+    
+    Returns False once the connection is closed, so idle streams (no ticks over
+    the weekend, unchanged positions) stop polling MT5 for departed clients.
+    Messages the client sends mid-stream are ignored.
+    """
+    try:
+        websocket.recv(timeout=timeout)
+    except TimeoutError:
+        pass
+    except ConnectionClosed:
+        return False
+    return True
+
+def _stream_market(websocket):
+    """
+    Push tick and new-candle events for the subscribed symbols
+    
+    The client may send {"symbols": [...], "timeframe": "M1"} right after
+    connecting; otherwise TICK_PUB_SYMBOLS on M1 are streamed.
+    """
+    try:
+        subscription = json.loads(websocket.recv(timeout=WS_SUBSCRIBE_TIMEOUT))
+    except TimeoutError:
+        subscription = {}
+    
+    symbols = subscription.get('symbols') or list(TICK_PUB_SYMBOLS)
+    timeframe_str = subscription.get('timeframe', 'M1')
+    timeframe = get_timeframe(timeframe_str)
+    last_tick_msc = {}
+    last_bar_time = {}
+    
+    while _client_wait(websocket, WS_POLL_INTERVAL):
+        if not mt5_initialized:
+            continue
+        
+        with terminal_gate.shared():
+            for symbol in symbols:
+                tick = cached_tick(symbol)
+                if tick is not None and last_tick_msc.get(symbol) != tick.time_msc:
+                    last_tick_msc[symbol] = tick.time_msc
+                    websocket.send(json.dumps({
+                        "type": "tick",
+                        "symbol": symbol,
+                        "time_msc": tick.time_msc,
+                        "bid": tick.bid,
+                        "ask": tick.ask
+                    }))
+                
+                rates = mt5.copy_rates_from_pos(symbol, timeframe, 0, 1)
+                if rates is not None and len(rates) and last_bar_time.get(symbol) != int(rates[0]['time']):
+                    last_bar_time[symbol] = int(rates[0]['time'])
+                    websocket.send(json.dumps({
+                        "type": "candle",
+                        "symbol": symbol,
+                        "timeframe": timeframe_str,
+                        "data": rates_to_rows(rates)[0]
+                    }))
+
+def _stream_positions(websocket):
+    """Push the open positions whenever a position opens, closes or changes size/SL/TP"""
+    last_state = None
+    
+    while True:
+        if mt5_initialized:
+            with terminal_gate.shared():
+                positions = mt5.positions_get() or ()
+            state = {pos.ticket: (pos.volume, pos.sl, pos.tp) for pos in positions}
+            if state != last_state:
+                last_state = state
+                websocket.send(json.dumps({
+                    "type": "positions",
+                    "positions": [position_to_dict(pos) for pos in positions]
+                }))
+        if not _client_wait(websocket, WS_POSITIONS_INTERVAL):
+            return
+
+def _websocket_handler(websocket):
+    """Route a WebSocket connection to its stream by path"""
+    path = websocket.request.path.split('?', 1)[0]
+    streams = {'/ws/ticks': _stream_market, '/ws/positions': _stream_positions}
+    
+    stream = streams.get(path)
+    if stream is None:
+        websocket.close(code=1008, reason="Unknown stream")
+        return
+    
+    try:
+        stream(websocket)
+    except ConnectionClosed:
+        pass
+    except Exception as e:
+        logger.error(f"WebSocket stream {path} error: {str(e)}")
+
+def start_websocket_server():
+    """Serve the WebSocket push streams on WS_PORT (requires websockets)"""
+    if not WEBSOCKETS_AVAILABLE:
+        return False
+    
+    server = serve_websockets(_websocket_handler, '0.0.0.0', WS_PORT)
+    threading.Thread(target=server.serve_forever, name="mt5-websockets", daemon=True).start()
+    return True
 
 if __name__ == '__main__':
     print("🚀 Starting MT5 REST API Server for macOS Bridge...")
@@ -358,5 +909,24 @@ if __name__ == '__main__':
         print("❌ MT5 initialization failed")
         print("💡 Make sure MT5 is installed and running")
     
-    # Start Flask server
-    app.run(host='0.0.0.0', port=8080, debug=False)
+    # Keep the terminal connection alive in the background
+    start_health_monitor()
+    
+    # Push ticks to subscribers instead of making them poll
+    if start_tick_publisher():
+        print(f"📡 Streaming ticks for {', '.join(TICK_PUB_SYMBOLS)} on tcp://0.0.0.0:{TICK_PUB_PORT}")
+    else:
+        print("💡 Install pyzmq to stream ticks over ZeroMQ (pip install pyzmq msgpack)")
+    
+    if start_websocket_server():
+        print(f"📡 WebSocket streams at ws://0.0.0.0:{WS_PORT}/ws/ticks and /ws/positions")
+    else:
+        print("💡 Install websockets to push ticks and positions (pip install websockets)")
+    
+    # Start server: waitress serves requests from a thread pool so a rates poll
+    # does not hold up order placement; Flask's threaded dev server is the fallback
+    if WAITRESS_AVAILABLE:
+        serve(app, host='0.0.0.0', port=8080, threads=16)
+    else:
+        print("💡 Install waitress for a production WSGI server (pip install waitress)")
+        app.run(host='0.0.0.0', port=8080, debug=False, threaded=True)